@@ -0,0 +1,185 @@
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import shutil
+import tempfile
+from concurrent.futures import as_completed
+
+import numpy as np
+from PIL import Image
+
+import model
+import executors
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp", ".npy")
+
+def load_recipe(file_name):
+    # a recipe is an ordered list of effects, either {"effect": name, "parameters": {...}} or [name, {...}]
+    # parameters that are not given keep the defaults of the GUI
+    with open(file_name, "r") as f:
+        steps = json.load(f)
+
+    recipe = []
+    for step in steps:
+        if isinstance(step, dict):
+            effect_name, parameters = step["effect"], step.get("parameters", {})
+        else:
+            effect_name, parameters = step[0], (step[1] if len(step) > 1 else {})
+        if effect_name not in model.DEFAULT_PARAMETERS:
+            raise ValueError("Unknown effect in recipe: %s" % effect_name)
+        full_parameters = dict(model.DEFAULT_PARAMETERS[effect_name])
+        full_parameters.update(parameters)
+        recipe.append((effect_name, full_parameters))
+    return recipe
+
+def find_images(inputs):
+    # inputs are directories, glob patterns or file names
+    file_names = []
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            candidates = sorted(glob.glob(os.path.join(pattern, "*")))
+        else:
+            candidates = sorted(glob.glob(pattern))
+        file_names += [f for f in candidates if f.lower().endswith(IMAGE_EXTENSIONS) and f not in file_names]
+    return file_names
+
+def read_image(file_name):
+    if file_name.lower().endswith(".npy"):
+        return model.to_working_precision(np.load(file_name))
+    return model.to_working_precision(np.array(Image.open(file_name)))
+
+def write_image(image, file_name):
+    if file_name.lower().endswith(".npy"):
+        np.save(file_name, image)
+        return
+    output = Image.fromarray(model.to_uint8(image))
+    if file_name.lower().endswith((".jpg", ".jpeg")) and output.mode not in ("RGB", "L"):
+        output = output.convert("RGB")
+    output.save(file_name)
+
+def init_process(precision):
+    model.set_working_precision(precision)
+
+def process_image(file_name, output_file_name, recipe):
+    # runs in a worker process, decoding, processing and encoding of different images overlap across the pool
+    t0 = time.perf_counter()
+    image = read_image(file_name)
+    t1 = time.perf_counter()
+    # consecutive warps of the recipe are sampled in one pass
+    image = model.apply_recipe(image, [(effect_name, parameters, read_image(parameters["image"]) if effect_name == "pers_mapping" else None)
+                                       for effect_name, parameters in recipe])
+    t2 = time.perf_counter()
+    write_image(image, output_file_name)
+    t3 = time.perf_counter()
+    return {"file": file_name, "output": output_file_name, "shape": image.shape,
+            "decode": t1-t0, "process": t2-t1, "encode": t3-t2, "total": t3-t0}
+
+def open_source(file_name, directory, tile_size):
+    # memory maps a .npy file, converting it to the working precision tile by tile if necessary
+    if not file_name.lower().endswith(".npy"):
+        return read_image(file_name)
+    source = np.load(file_name, mmap_mode="r")
+    if source.dtype == model.WORKING_DTYPE:
+        return source
+    image = np.lib.format.open_memmap(os.path.join(directory, "source.npy"), mode="w+",
+                                      dtype=model.WORKING_DTYPE, shape=source.shape)
+    for r0, r1, c0, c1 in model.tiles(source.shape, tile_size):
+        image[r0:r1, c0:c1] = model.to_working_precision(np.asarray(source[r0:r1, c0:c1]))
+    return image
+
+def process_image_tiled(file_name, output_file_name, recipe, tile_size):
+    # like process_image, but every step reads from and writes to memory-mapped files in a temporary directory, so
+    # images larger than the RAM can be processed. a .npy output is written in place by the last step.
+    t0 = time.perf_counter()
+    directory = tempfile.mkdtemp(prefix="image-processing-tiles-")
+    try:
+        image = open_source(file_name, directory, tile_size)
+        t1 = time.perf_counter()
+        for step, (effect_name, parameters) in enumerate(recipe):
+            second_image = None
+            if effect_name == "pers_mapping":
+                second_image = read_image(parameters["image"])
+            f, params, split_dimensions = model.prepare_effect(effect_name, image, parameters, arrH=second_image)
+            if step == len(recipe)-1 and output_file_name.lower().endswith(".npy"):
+                path = output_file_name
+            else:
+                path = os.path.join(directory, "step-%d.npy" % step)
+            out = np.lib.format.open_memmap(path, mode="w+", dtype=model.WORKING_DTYPE,
+                                            shape=model.output_shape(f, params))
+            image = model.process_tiled(f, params, split_dimensions, out=out, tile_size=tile_size)
+        t2 = time.perf_counter()
+        if isinstance(image, np.memmap) and image.filename == os.path.abspath(output_file_name):
+            image.flush()
+        else:
+            write_image(image, output_file_name)
+        t3 = time.perf_counter()
+        shape = image.shape
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return {"file": file_name, "output": output_file_name, "shape": shape,
+            "decode": t1-t0, "process": t2-t1, "encode": t3-t2, "total": t3-t0}
+
+def run(recipe, file_names, output_dir, jobs=None, extension=None, precision="float32", tile_size=None, executor="process"):
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = jobs or os.cpu_count()
+    results = []
+    t0 = time.perf_counter()
+    with executors.make_executor(executor, jobs, init_process, (precision,)) as pool:
+        futures = {}
+        for file_name in file_names:
+            base, ext = os.path.splitext(os.path.basename(file_name))
+            output_file_name = os.path.join(output_dir, base + (extension or ext))
+            if tile_size:
+                futures[pool.submit(process_image_tiled, file_name, output_file_name, recipe, tile_size)] = file_name
+            else:
+                futures[pool.submit(process_image, file_name, output_file_name, recipe)] = file_name
+
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                print("%s: failed, %s" % (futures[future], e), file=sys.stderr)
+                continue
+            results.append(result)
+            megapixels = result["shape"][0] * result["shape"][1] / 1e6
+            print("%s  %dx%d  decode %.3fs  process %.3fs  encode %.3fs  total %.3fs  (%.2f MP/s)" % (
+                  result["file"], result["shape"][1], result["shape"][0], result["decode"], result["process"],
+                  result["encode"], result["total"], megapixels / result["total"]))
+    wall_time = time.perf_counter() - t0
+
+    megapixels = sum(r["shape"][0] * r["shape"][1] for r in results) / 1e6
+    print("\n%d of %d images, %.1f MP in %.2fs with %d %s workers" % (len(results), len(file_names), megapixels,
+                                                                    wall_time, jobs, executor))
+    if results and wall_time > 0:
+        print("throughput: %.2f images/s, %.2f MP/s" % (len(results) / wall_time, megapixels / wall_time))
+        for stage in ("decode", "process", "encode"):
+            print("%-8s %.2fs total, %.3fs mean" % (stage, sum(r[stage] for r in results),
+                                                    np.mean([r[stage] for r in results])))
+    return results
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Applies a recipe of effects to many images without the GUI")
+    parser.add_argument("recipe", help="json file with the ordered list of effects and their parameters")
+    parser.add_argument("inputs", nargs="+", help="image files, directories or glob patterns")
+    parser.add_argument("-o", "--output", default="output", help="output directory")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of workers, defaults to the number of cores")
+    parser.add_argument("--executor", choices=executors.EXECUTORS, default="process",
+                        help="runs the images on a process pool (default), a thread or qt pool or inline")
+    parser.add_argument("--format", default=None, help="extension of the output files, e.g. png, defaults to the input extension")
+    parser.add_argument("--precision", choices=list(model.PRECISIONS), default="float32")
+    parser.add_argument("--tile-size", type=int, default=None,
+                        help="process tiles of this size through memory-mapped files, for images larger than the RAM")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+
+    args = parse_arguments()
+    file_names = find_images(args.inputs)
+    if not file_names:
+        sys.exit("No images found")
+    extension = None if args.format is None else "." + args.format.lstrip(".")
+    run(load_recipe(args.recipe), file_names, args.output, args.jobs, extension, args.precision, args.tile_size, args.executor)
@@ -0,0 +1,171 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+
+import numpy as np
+from PIL import Image
+
+import model
+
+INPUT_IMAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "input_images", "background.jpg")
+SECOND_IMAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "input_images", "linux_penguin_RGBA.png")
+
+# parameter extremes of every effect, functions of the image size (M, N) so that positions and radii scale with it
+CASES = {
+    "fisheye":      {"small": lambda M, N: {"x": N/2, "y": M/2, "sigma": 10.},
+                     "large": lambda M, N: {"x": N/2, "y": M/2, "sigma": float(max(M, N))}},
+    "swirl":        {"small": lambda M, N: {"x": N/2, "y": M/2, "sigma": 0.1, "magnitude": 0.5},
+                     "large": lambda M, N: {"x": N/2, "y": M/2, "sigma": 1.0, "magnitude": 10}},
+    "waves":        {"small": lambda M, N: {"amplitude": 1., "frequency": 5., "phase": 0},
+                     "large": lambda M, N: {"amplitude": 50., "frequency": 50., "phase": 1}},
+    "cylinder":     {"small": lambda M, N: {"angle": 0.},
+                     "large": lambda M, N: {"angle": 180.}},
+    "radial_blur":  {"small": lambda M, N: {"sigma": 0.5},
+                     "large": lambda M, N: {"sigma": 20.}},
+    "pers_mapping": {"bilinear": lambda M, N: {"x1": N*0.1, "y1": M*0.1, "x2": N*0.9, "y2": M*0.2,
+                                               "x3": N*0.2, "y3": M*0.9, "x4": N*0.8, "y4": M*0.8, "order": 1},
+                     "cubic":    lambda M, N: {"x1": 0, "y1": 0, "x2": N, "y2": 0, "x3": 0, "y3": M, "x4": N, "y4": M, "order": 3}},
+    "square_eye":   {"small": lambda M, N: {"x": N/2, "y": M/2, "sigma": 10., "p_value": 0.5},
+                     "large": lambda M, N: {"x": N/2, "y": M/2, "sigma": float(max(M, N)), "p_value": 4.}},
+    "median":       {"small": lambda M, N: {"size": 3.},
+                     "large": lambda M, N: {"size": 41.}},
+    "gaussian":     {"small": lambda M, N: {"radius": 1.},
+                     "large": lambda M, N: {"radius": 40.}},
+    "bilateral":    {"small": lambda M, N: {"sigma": 2., "rho": 0.05},
+                     "large": lambda M, N: {"sigma": 20., "rho": 1.}},
+    "mean":         {"small": lambda M, N: {"size": 3.},
+                     "large": lambda M, N: {"size": 101.}},
+}
+
+def load_image(megapixels, channels):
+    # the bundled image resized to the given number of pixels
+    image = Image.open(INPUT_IMAGE).convert("RGB")
+    scale = np.sqrt(megapixels * 1e6 / (image.width * image.height))
+    image = image.resize((max(int(image.width*scale), 1), max(int(image.height*scale), 1)), Image.BICUBIC)
+    arr = model.to_working_precision(np.array(image))
+    return np.ascontiguousarray(arr[:,:,0]) if channels == 1 else arr
+
+def measure(f, params, split_dimensions, repeat, warm=False):
+    # peak memory of a traced run, then the best wall time of repeat untraced runs
+    # the caches of model.py are cleared before every run unless warm is set
+    model.clear_caches()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    model.run_effect(f, params, split_dimensions)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    times = []
+    for _ in range(repeat):
+        if not warm:
+            model.clear_caches()
+        t0 = time.perf_counter()
+        model.run_effect(f, params, split_dimensions)
+        times.append(time.perf_counter() - t0)
+    return min(times), peak
+
+def run(effects, sizes, channel_counts, repeat=1, warm=False):
+    second_image = model.to_working_precision(np.array(Image.open(SECOND_IMAGE)))
+    results = []
+    for megapixels in sizes:
+        for channels in channel_counts:
+            image = load_image(megapixels, channels)
+            M, N = image.shape[:2]
+            for effect_name in effects:
+                for case, parameters in CASES[effect_name].items():
+                    f, params, split_dimensions = model.prepare_effect(effect_name, image, parameters(M, N),
+                                                                       arrH=second_image)
+                    seconds, peak = measure(f, params, split_dimensions, repeat, warm)
+                    result = {"effect": effect_name, "case": case, "megapixels": megapixels, "channels": channels,
+                              "shape": list(image.shape), "time": seconds, "mp_per_s": M*N/1e6/seconds,
+                              "peak_memory": peak}
+                    results.append(result)
+                    print("%-12s %-8s %5.1f MP %d ch  %8.3fs  %8.2f MP/s  %8.1f MB" % (
+                          effect_name, case, megapixels, channels, seconds, result["mp_per_s"], peak/2**20))
+                    sys.stdout.flush()
+    return results
+
+# effects of a recipe that apply_recipe does not fuse, so that it has to match applying them one by one
+CHECK_RECIPE = [("fisheye", lambda M, N: {"x": N/2, "y": M/2, "sigma": min(M, N)/3}),
+                ("pers_mapping", lambda M, N: {"x1": N*0.1, "y1": M*0.1, "x2": N*0.9, "y2": M*0.2,
+                                               "x3": N*0.2, "y3": M*0.9, "x4": N*0.8, "y4": M*0.8}),
+                ("gaussian", lambda M, N: {"radius": 2.}),
+                ("swirl", lambda M, N: {"x": N/3, "y": M/3, "sigma": 0.3, "magnitude": 2.})]
+
+def check_recipe(tolerance=1e-5):
+    # largest difference between apply_recipe and apply_effect step by step on the bundled images
+    image = load_image(0.5, 3)
+    second_image = model.to_working_precision(np.array(Image.open(SECOND_IMAGE)))
+    M, N = image.shape[:2]
+    recipe = [(effect_name, dict(model.DEFAULT_PARAMETERS[effect_name], **parameters(M, N)),
+               second_image if effect_name == "pers_mapping" else None) for effect_name, parameters in CHECK_RECIPE]
+    expected = image
+    for effect_name, parameters, arrH in recipe:
+        expected = model.apply_effect(expected, effect_name, parameters, arrH=arrH)
+    output = model.apply_recipe(image, recipe)
+    error = np.abs(output.astype(np.float64) - expected).max() if output.shape == expected.shape else np.inf
+    print("apply_recipe against apply_effect: max difference %.3g" % error)
+    return error <= tolerance * (255 if image.dtype == np.uint8 else 1)
+
+def result_key(result):
+    return (result["effect"], result["case"], result["megapixels"], result["channels"])
+
+def compare(results, baseline, threshold):
+    # results that are slower or need more memory than the baseline by more than the threshold (a fraction)
+    reference = {result_key(r): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        base = reference.get(result_key(result))
+        if base is None:
+            continue
+        for metric in ("time", "peak_memory"):
+            if base[metric] > 0 and result[metric] > base[metric] * (1 + threshold):
+                regressions.append(dict(result_key=list(result_key(result)), metric=metric,
+                                        baseline=base[metric], value=result[metric], ratio=result[metric]/base[metric]))
+    return regressions
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Measures time, throughput and peak memory of the effects of model.py")
+    parser.add_argument("--effects", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--sizes", nargs="+", type=float, default=[0.5, 4, 12, 24], help="image sizes in megapixels")
+    parser.add_argument("--channels", nargs="+", type=int, choices=[1, 3], default=[1, 3])
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per case, the fastest one is reported")
+    parser.add_argument("--warm", action="store_true",
+                        help="keep the cached grids and tables between runs, like moving a slider in the GUI does")
+    parser.add_argument("--precision", choices=list(model.PRECISIONS), default="float32")
+    parser.add_argument("--check", action="store_true",
+                        help="checks that apply_recipe gives the result of applying the effects one by one and exits")
+    parser.add_argument("-o", "--output", default=None, help="json file for the results")
+    parser.add_argument("--baseline", default=None, help="json file of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative slowdown or memory growth against the baseline that counts as a regression")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+
+    args = parse_arguments()
+    model.set_working_precision(args.precision)
+    if args.check:
+        sys.exit(0 if check_recipe() else 1)
+    results = run(args.effects, args.sizes, args.channels, args.repeat, args.warm)
+
+    report = {"precision": args.precision, "warm": args.warm, "numpy": np.__version__, "python": platform.python_version(),
+              "machine": platform.machine(), "cpu_count": os.cpu_count(), "results": results}
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1)
+
+    if args.baseline is not None:
+        with open(args.baseline, "r") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for r in regressions:
+            print("REGRESSION %s %s: %.4g -> %.4g (x%.2f)" % (" ".join(str(k) for k in r["result_key"]), r["metric"],
+                                                             r["baseline"], r["value"], r["ratio"]))
+        if regressions:
+            sys.exit(1)
+        print("no regressions against %s" % args.baseline)
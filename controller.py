@@ -1,31 +1,52 @@
+import time
+STARTED = time.perf_counter() # startup times are measured from here
+
+import os
 import sys
 from PySide6 import QtWidgets
-from PySide6.QtWidgets import QApplication, QTabWidget, QGraphicsScene, QFileDialog, QMessageBox, QGraphicsView
+from PySide6.QtWidgets import QApplication, QTabWidget, QGraphicsScene, QFileDialog, QMessageBox, QGraphicsView, QInputDialog
 
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import Slot, Qt, QDir, QObject, QEvent
+from PySide6.QtCore import Slot, Qt, QDir, QObject, QEvent, QTimer
 from PySide6.QtGui import QPixmap, QIcon, QImageReader, QGuiApplication, QPainter, QImage
 
-import imageio
 import numpy as np
-import matplotlib.pyplot as plt
-from PIL import ImageQt, Image
+from PIL import Image, ImageFile, ImageOps
 
-import time
+import argparse
 from queue import Queue
 from PySide6.QtCore import QRunnable, Slot, QThreadPool, Signal, QObject, QMutex
 from threading import Event
 
 import traceback
+import copy
+from collections import deque
+from functools import partial
 
 import model
+import executors
+import timings
+from history import History
+
+try:
+    # compiled from mainwindow.ui with: pyside6-uic mainwindow.ui -o ui_mainwindow.py
+    # run it again after editing mainwindow.ui, or delete ui_mainwindow.py to load mainwindow.ui at runtime
+    from ui_mainwindow import Ui_MainWindow
+except ImportError:
+    Ui_MainWindow = None
 
 class WorkerSignals(QObject):
-    processed = Signal(object)
+    processed = Signal(object, object)
     terminated = Signal()
 
+# previews are computed in tiles of this size, a preview that has been superseded stops at the next tile
+PREVIEW_TILE_SIZE = 512
+
+# spline order of the previews of the effects that sample the image: 0 nearest, 1 bilinear, 3 cubic.
+# applied effects are always sampled with cubic splines.
+PREVIEW_ORDERS = {"fisheye": 1, "swirl": 1, "waves": 1, "cylinder": 1, "square_eye": 1, "pers_mapping": 1}
+
 class Worker(QRunnable):
-    def __init__(self):
+    def __init__(self, executor=None):
         super(Worker, self).__init__()
         self.signals = WorkerSignals()
         self.terminate = False
@@ -34,71 +55,223 @@ class Worker(QRunnable):
         self.f = None
         self.params = None
         self.split_dimensions = True
-        self.threadpool = QThreadPool()
+        self.tag = None
+        self.generation = 0 # counts the submitted jobs, a preview of an older generation is not needed anymore
+        self.apply_jobs = Queue()
+        self.executor = executor if executor is not None else executors.make_executor("qt")
 
     @Slot()
     def run(self):
         print("Worker started")
-        while not self.terminate:
+        while True:
+            self.new_data_arrived.wait() # woken by process() and stop()
+            if self.terminate:
+                break
+
+            self.mutex.lock()
+            if not self.apply_jobs.empty():
+                # jobs of the apply buttons are never replaced by newer previews
+                f, params, split_dimensions, tag = self.apply_jobs.get()
+                if self.apply_jobs.empty() and self.f is None:
+                    self.new_data_arrived.clear()
+                checkpoint = self.stop_checkpoint
+            else:
+                self.new_data_arrived.clear()
+                f, params, split_dimensions, tag = self.f, self.params, self.split_dimensions, self.tag
+                self.f = None
+                generation = self.generation
+                checkpoint = lambda: self.preview_checkpoint(generation)
+            self.mutex.unlock()
+            if f is None:
+                continue
+
             try:
-                self.new_data_arrived.wait(timeout=1)
-            except:
+                timings.current.take() # stages of cancelled frames are not counted
+                t0 = time.perf_counter()
+                # warps build their coordinate map once per tile, every channel is resampled from it
+                output = model.process_tiled(f, params, split_dimensions, tile_size=PREVIEW_TILE_SIZE,
+                                             checkpoint=checkpoint, mapper=self.map_channels)
+                if tag is not None:
+                    tag["stages"] = dict(timings.current.take(), compute=time.perf_counter()-t0)
+                self.signals.processed.emit(output, tag)
+            except model.Cancelled:
                 pass
-
-            if self.new_data_arrived.is_set():
-                self.mutex.lock()
-                self.new_data_arrived.clear()
-                f = self.f
-                params = self.params
-                self.mutex.unlock()
-
-                try:
-                    if len(params[0].shape)==2 or not self.split_dimensions:
-                        output = f(*params)
-                    elif len(params[0].shape)==3:
-                        finished_events = []
-                        output = []
-                        for i in range(params[0].shape[2]):
-                            output.append(None)
-                            e = Event()
-                            finished_events.append(e)
-                            params_ = (params[0][:,:,i], *(params[1:]))
-                            temp_worker = TemporaryWorker(f, params_, output, i, e)
-                            self.threadpool.start(temp_worker)
-                        for e in finished_events:
-                            e.wait()
-                        output = np.stack(output, axis=2)
-                    self.signals.processed.emit(np.array(output))
-                except Exception:
-                    exc_info = sys.exc_info()
-                    traceback.print_exception(*exc_info)
+            except Exception:
+                exc_info = sys.exc_info()
+                traceback.print_exception(*exc_info)
         print("Worker stopped")
 
+    def stop_checkpoint(self):
+        if self.terminate:
+            raise model.Cancelled()
+
+    def preview_checkpoint(self, generation):
+        # a newer preview or an apply job has been submitted meanwhile
+        if self.terminate or self.generation != generation:
+            raise model.Cancelled()
+
+    def map_channels(self, function, items):
+        # runs function on every item (e.g. the channels of a tile) on the executor
+        items = list(items)
+        if len(items) <= 1:
+            return [function(item) for item in items]
+        return executors.map_jobs(self.executor, function, items)
+
     @Slot(object, object)
-    def process(self, f, parameters, split_dimensions=True):
+    def process(self, f, parameters, split_dimensions=True, tag=None):
         self.mutex.lock()
-        self.f = f
-        self.params = parameters
-        self.split_dimensions = split_dimensions
+        if tag is not None and tag.get("apply") is not None:
+            self.apply_jobs.put((f, parameters, split_dimensions, tag))
+        else:
+            self.f = f
+            self.params = parameters
+            self.split_dimensions = split_dimensions
+            self.tag = tag
+        self.generation += 1
         self.new_data_arrived.set()
         self.mutex.unlock()
 
-class TemporaryWorker(QRunnable):
-    def __init__(self, f, params, output, idx, finished_event):
-        super(TemporaryWorker, self).__init__()
-        self.f = f
-        self.params = params
-        self.output = output
-        self.idx = idx
-        self.finished_event = finished_event
+    def cancel(self):
+        # drops the pending preview and aborts the running one
+        self.mutex.lock()
+        self.f = None
+        self.generation += 1
+        self.mutex.unlock()
 
-    @Slot()
-    def run(self):
-        #print("TemporaryWorker started")
-        self.output[self.idx] = self.f(*self.params)
-        self.finished_event.set()
-        #print("TemporaryWorker stopped")
+    def stop(self):
+        self.terminate = True
+        self.new_data_arrived.set()
+
+class LoaderSignals(QObject):
+    draft = Signal(object, object)
+    progress = Signal(float, object)
+    loaded = Signal(object, object)
+    failed = Signal(str, object)
+
+# files are read and decoded in chunks of this size, progress is reported after every chunk
+LOAD_CHUNK_SIZE = 256*2**10
+
+def decode_draft(file_name, size):
+    # a reduced decode of a jpeg, scaled by 1/2, 1/4 or 1/8 while the dct is decoded and still at least as large as
+    # size. returns the pixels and the pyramid level of the scale, None for formats without drafts.
+    image = Image.open(file_name)
+    width = image.width
+    if image.draft(image.mode, size) is None or image.width == width:
+        return None
+    level = int(round(np.log2(width / image.width)))
+    return np.array(ImageOps.exif_transpose(image)), level
+
+def decode_image(file_name, progress=None, chunk_size=LOAD_CHUNK_SIZE):
+    # decodes the file while it is read, progress is called with the fraction read so far
+    parser = ImageFile.Parser()
+    size = max(os.path.getsize(file_name), 1)
+    done = 0
+    with open(file_name, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            parser.feed(chunk)
+            done += len(chunk)
+            if progress is not None:
+                progress(done / size)
+    return np.array(ImageOps.exif_transpose(parser.close()))
+
+def load_image(signals, file_name, tag, draft_size=None):
+    # runs on the thread pool. the file is decoded once, the gui shows and processes the same pixels.
+    # a draft of a jpeg is sent first if draft_size is given, then the full image in the working precision.
+    try:
+        if draft_size is not None:
+            draft = decode_draft(file_name, draft_size)
+            if draft is not None:
+                signals.draft.emit(draft, tag)
+        image = decode_image(file_name, lambda fraction: signals.progress.emit(fraction, tag))
+        signals.loaded.emit(model.to_working_precision(image), tag)
+    except Exception as e:
+        signals.failed.emit(str(e), tag)
+
+class SaverSignals(QObject):
+    saved = Signal(object)
+    failed = Signal(str, object)
+
+# formats of the save dialog with the encoder setting asked for, the label, range and default of an integer setting
+# or the label and choices of a selection. tiff compressions other than raw need libtiff.
+SAVE_FORMATS = {
+    ".png":  ("PNG (*.png)", "PNG compression level (0 is fastest, 9 smallest):", 0, 9, 1),
+    ".jpg":  ("JPEG (*.jpg *.jpeg)", "JPEG quality:", 1, 100, 95),
+    ".webp": ("WebP (*.webp)", "WebP quality (100 is lossless):", 1, 100, 100),
+    ".tif":  ("TIFF (*.tif *.tiff)", "TIFF compression:", ["tiff_deflate", "tiff_lzw", "packbits", "raw"]),
+    ".bmp":  ("BMP (*.bmp)", None),
+}
+SAVE_EXTENSIONS = {".jpeg": ".jpg", ".tiff": ".tif"}
+
+def save_options(extension, setting):
+    # keyword arguments of the PIL encoder of the format for the setting of the save dialog
+    extension = SAVE_EXTENSIONS.get(extension, extension)
+    if extension == ".png":
+        return {"compress_level": setting}
+    if extension == ".jpg":
+        return {"quality": setting}
+    if extension == ".webp":
+        # the least effort of the lossless encoder, about eight times faster than the default and still smaller than png
+        return {"lossless": True, "quality": 0, "method": 0} if setting >= 100 else {"quality": setting}
+    if extension == ".tif":
+        return {"compression": setting}
+    return {}
+
+def save_image(signals, image, file_name, options, tag):
+    # runs on the thread pool. images are replaced and never modified in place, so image is a snapshot of the image
+    # at the time of saving although editing goes on.
+    try:
+        output = Image.fromarray(model.to_uint8(image))
+        if file_name.lower().endswith((".jpg", ".jpeg")) and output.mode not in ("RGB", "L"):
+            output = output.convert("RGB")
+        output.save(file_name, **options)
+        signals.saved.emit(tag)
+    except Exception as e:
+        signals.failed.emit(str(e), tag)
+
+def to_qimage(buffer):
+    # wraps the pixels of a contiguous uint8 array without copying them, the array has to outlive the QImage
+    M, N = buffer.shape[:2]
+    channels = 1 if buffer.ndim == 2 else buffer.shape[2]
+    formats = {1: QImage.Format_Grayscale8, 3: QImage.Format_RGB888, 4: QImage.Format_RGBA8888}
+    return QImage(buffer.data, N, M, buffer.strides[0], formats[channels])
+
+def load_main_window():
+    # the widgets of the compiled form become attributes of the window, like those of a window loaded by QUiLoader
+    if Ui_MainWindow is None:
+        from PySide6.QtUiTools import QUiLoader
+        return QUiLoader().load("mainwindow.ui", None)
+    window = QtWidgets.QMainWindow()
+    ui = Ui_MainWindow()
+    ui.setupUi(window)
+    for name, widget in vars(ui).items():
+        setattr(window, name, widget)
+    return window
+
+class StartupTimer(QObject):
+    # prints the time from the start of the process to the first paint of the window, split into the import of the
+    # modules, the creation of the application and the window and the first paint. quits the application if asked to.
+    def __init__(self, stages, quit=False):
+        super(StartupTimer, self).__init__()
+        self.stages = stages
+        self.quit = quit
+        self.painted = False
 
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and not self.painted:
+            self.painted = True
+            QTimer.singleShot(0, self.report) # after the paint event has been handled
+        return super(StartupTimer, self).eventFilter(obj, event)
+
+    def report(self):
+        now = time.perf_counter()
+        times, previous = [], STARTED
+        for name, t in self.stages + [("first paint", now)]:
+            times.append("%s %.3fs" % (name, t - previous))
+            previous = t
+        print("startup: time to first window %.3fs (%s)" % (now - STARTED, ", ".join(times)))
+        sys.stdout.flush()
+        if self.quit:
+            QApplication.instance().quit()
 
 class MouseDetector(QObject):
 
@@ -125,23 +298,54 @@ class MouseDetector(QObject):
 
 
 class MyApplication():
-    def __init__(self):
-        loader = QUiLoader()
-        self.window = loader.load("mainwindow.ui", None)
+    def __init__(self, history_options=None, executor=None, result_cache_size=256*2**20, timing_log=None,
+                 preview_orders=None):
+        self.window = load_main_window()
 
 
         #For threading
         QApplication.instance().aboutToQuit.connect(self.exit_handler)
         self.threadpool = QThreadPool()
-        self.worker = Worker()
+        # the worker keeps one thread, images are loaded and modules preloaded on another one
+        self.threadpool.setMaxThreadCount(max(self.threadpool.maxThreadCount(), 2))
+        self.worker = Worker(executor)
         self.threadpool.start(self.worker)
         self.worker.signals.processed.connect(self.update_image_view, Qt.QueuedConnection)
+        self.loader_signals = LoaderSignals()
+        self.loader_signals.draft.connect(self.show_draft, Qt.QueuedConnection)
+        self.loader_signals.progress.connect(self.show_load_progress, Qt.QueuedConnection)
+        self.loader_signals.loaded.connect(self.image_loaded, Qt.QueuedConnection)
+        self.loader_signals.failed.connect(self.image_load_failed, Qt.QueuedConnection)
+        self.load_requests = {"graphicsView": 0, "persmap_graphicsView": 0} # only the latest file of a view is shown
+        self.saver_signals = SaverSignals()
+        self.saver_signals.saved.connect(self.image_saved, Qt.QueuedConnection)
+        self.saver_signals.failed.connect(self.image_save_failed, Qt.QueuedConnection)
+        self.save_settings = {} # the latest setting of every format is the default of the next save
 
 
         self.image = None
+        self.pyramid = None
         self.preview_image = None
         self.persmap_image = None
-        self.images_stack = []
+        self.history = History(**(history_options or {}))
+        self.image_version = 0    # changes with every new image, results of older images are not used anymore
+        self.persmap_version = 0
+        self.applied_versions = {} # image version -> version committed by an apply rendered from it
+        self.pending_applies = 0   # applies queued in the worker, committed in the order they were requested
+        self.request = 0          # only the result of the latest preview request is shown
+        self.result_cache = model.LRUCache(max_bytes=result_cache_size) # rendered previews and applied results
+        self.preview_orders = dict(PREVIEW_ORDERS, **(preview_orders or {}))
+        self.timings = timings.Timings(log_file=timing_log) # stage times per effect, shown in the status bar
+        self.display_times = timings.StageTimes()
+        self.frame_times = deque(maxlen=30) # when the latest previews were shown, for the frame rate
+
+        # the main view keeps one scene and one pixmap item, frames only swap the pixmap
+        self.scene = QGraphicsScene()
+        self.image_item = self.scene.addPixmap(QPixmap())
+        self.window.graphicsView.setScene(self.scene)
+        self.view_size = None     # size of the shown image in full resolution pixels, the view is fitted when it changes
+        self.view_buffer = None   # uint8 pixels of the shown image, reused while the size does not change
+        self.view_scratch = None
 
         self.current_tab_idx = 0
         self.current_tab_name = "About"
@@ -198,10 +402,17 @@ class MyApplication():
 
         self.mainwindow_setup()
         self.window.show()
+        # scipy is imported by the first effect otherwise
+        QTimer.singleShot(0, lambda: self.threadpool.start(model.preload))
 
     # For threading
     def exit_handler(self):
-        self.worker.terminate = True
+        print("result cache: %d hits, %d misses" % (self.result_cache.hits, self.result_cache.misses))
+        self.worker.stop()
+        self.threadpool.waitForDone() # images that are being saved are written completely
+        self.worker.executor.shutdown(wait=False)
+        self.history.close()
+        self.timings.close()
 
     def mainwindow_setup(self):
         w = self.window
@@ -373,93 +584,149 @@ class MyApplication():
             self.update_image(effect_name)
             #print("update_image_function called")
 
-    def update_image(self, effect_name):
-        if effect_name=="fisheye":
-            center_point = (self.parameters[effect_name]["y"],self.parameters[effect_name]["x"])
-            sigma = self.parameters[effect_name]["sigma"]
-            #output_image = model.fisheye_effect(self.image, center_point, sigma)
-            self.worker.process(model.fisheye_effect, (self.image, center_point, sigma))
-
-        elif effect_name=="swirl":
-            center_point = (self.parameters[effect_name]["y"],self.parameters[effect_name]["x"])
-            sigma = self.parameters[effect_name]["sigma"]
-            magnitude = self.parameters[effect_name]["magnitude"]
-            #output_image = model.swirl_effect(self.image, center_point, sigma, magnitude)
-            self.worker.process(model.swirl_effect, (self.image, center_point, sigma, magnitude))
-
-        elif effect_name=="waves":
-            amplitude = [self.parameters[effect_name]["amplitude"], self.parameters[effect_name]["amplitude"]]
-            frequency = [self.parameters[effect_name]["frequency"], self.parameters[effect_name]["frequency"]]
-            phase = [self.parameters[effect_name]["phase"], self.parameters[effect_name]["phase"]]
-            #output_image = model.waves_effect(self.image, amplitude, frequency, phase)
-            self.worker.process(model.waves_effect, (self.image, amplitude, frequency, phase))
-
-        elif effect_name=="cylinder":
-            self.worker.process(model.cylinder, (self.image, self.parameters[effect_name]["angle"]))
-
-        elif effect_name=="radial_blur":
-            self.worker.process(model.radial_blur_effect, (self.image, self.parameters[effect_name]["sigma"]))
-            #output_image = model.radial_blur_effect(self.image, sigma=self.parameters[effect_name]["sigma"])
-
-        elif effect_name=="pers_mapping":
-            if self.persmap_image is not None:
-                u_ul = (self.parameters[effect_name]["x1"], self.parameters[effect_name]["y1"])
-                u_ur = (self.parameters[effect_name]["x2"], self.parameters[effect_name]["y2"])
-                u_ll = (self.parameters[effect_name]["x3"], self.parameters[effect_name]["y3"])
-                u_lr = (self.parameters[effect_name]["x4"], self.parameters[effect_name]["y4"])
-                self.worker.process(model.perspective_mapping, (self.persmap_image, self.image, u_ul, u_ur, u_ll, u_lr), split_dimensions=False)
-
-        elif effect_name=="square_eye":
-            center_point = (self.parameters[effect_name]["y"],self.parameters[effect_name]["x"])
-            sigma = self.parameters[effect_name]["sigma"]
-            p_value = self.parameters[effect_name]["p_value"]
-            #output_image = model.square_eye_effect(self.image, center_point, sigma, p_value)
-            self.worker.process(model.square_eye_effect, (self.image, center_point, sigma, p_value))
-
-        elif effect_name=="median":
-            self.worker.process(model.median_filter, (self.image, self.parameters[effect_name]["size"]))
-
-        elif effect_name=="gaussian":
-            self.worker.process(model.gaussian_filter, (self.image, self.parameters[effect_name]["radius"]))
-
-        elif effect_name=="bilateral":
-            sigma = self.parameters[effect_name]["sigma"]
-            rho = self.parameters[effect_name]["rho"]
-            self.worker.process(model.bilateral_filter, (self.image, sigma, rho))
-
-        elif effect_name=="mean":
-            self.worker.process(model.mean_filter, (self.image, self.parameters[effect_name]["size"]))
+    def update_image(self, effect_name, apply_label=None, parameters=None):
+        # previews are rendered on the pyramid level matching the view, pixel sized parameters are scaled to it
+        # the apply buttons render the effect on the full resolution image
+        if effect_name=="pers_mapping" and self.persmap_image is None:
+            return
+        level = 0 if apply_label is not None else self.preview_level()
+        parameters = dict(self.parameters[effect_name] if parameters is None else parameters)
+        if apply_label is None and effect_name in self.preview_orders:
+            parameters["order"] = self.preview_orders[effect_name] # e.g. bilinear while a slider is dragged
+        self.request += 1
+        key = (self.image_version, self.persmap_version if effect_name=="pers_mapping" else None, level,
+               effect_name, tuple(sorted(parameters.items())))
+        tag = {"level": level, "apply": apply_label, "source": self.image, "version": self.image_version,
+               "effect": effect_name, "parameters": parameters, "key": key, "request": self.request,
+               "requested": time.perf_counter()}
+        # a cached apply would be committed ahead of the applies still queued in the worker
+        output_image = self.result_cache.get(key) if apply_label is None or self.pending_applies == 0 else None
+        if output_image is not None:
+            # revisited parameters are shown at once, the preview of the previous ones is not needed anymore
+            self.worker.cancel()
+            self.update_image_view(output_image, tag)
+            return
+        f, params, split_dimensions = model.prepare_effect(effect_name, self.pyramid[level], parameters, 0.5**level, self.persmap_image)
+        if apply_label is not None:
+            self.pending_applies += 1
+            tag["queued"] = True
+        self.worker.process(f, params, split_dimensions, tag=tag)
 
 
     # For threading
-    @Slot(object)
-    def update_image_view(self, output_image):
-        self.preview_image = output_image.copy()
-
-        if np.issubdtype(output_image.dtype, np.floating):
-            output_image = (output_image*255).astype(np.uint8)
-
-        view_image = ImageQt.ImageQt( Image.fromarray(output_image) ) # convert output_image to qimage
-        pixmap = QPixmap.fromImage(view_image)
-        self.scene = QGraphicsScene()
-        self.scene.addPixmap(pixmap)
-        self.window.graphicsView.setScene(self.scene)
-        item = self.window.graphicsView.items()
-        self.window.graphicsView.fitInView(item[0],Qt.KeepAspectRatio)
+    @Slot(object, object)
+    def update_image_view(self, output_image, tag=None):
+        level = 0
+        if tag is not None:
+            if tag.get("queued"):
+                self.pending_applies -= 1
+            if tag["source"] is not self.image:
+                if tag["apply"] is not None and self.applied_version(tag["version"]) == self.image_version:
+                    # applied while an earlier apply was pending, rendered again on the image it committed
+                    self.update_image(tag["effect"], tag["apply"], tag["parameters"])
+                return # rendered from an image that has been replaced meanwhile
+            self.result_cache.put(tag["key"], output_image, output_image.nbytes)
+            if tag["apply"] is None and tag["request"] != self.request:
+                return # a newer preview has been requested meanwhile
+            if tag["apply"] is not None:
+                self.commit_image(tag["apply"], output_image, tag["effect"], tag["parameters"])
+                self.applied_versions[tag["version"]] = self.image_version
+            else:
+                self.preview_image = output_image # results of the worker are not modified afterwards
+            level = tag["level"]
+
+        self.show_image(output_image, level)
+        if tag is not None:
+            self.record_timings(tag, output_image.shape)
+
+    def applied_version(self, version):
+        # latest image version reached from the given one by commits of applies only
+        while version in self.applied_versions:
+            version = self.applied_versions[version]
+        return version
+
+    def record_timings(self, tag, shape):
+        # the stages of the worker and of the display of a frame, the status bar shows the latest frame of the effect
+        stages = dict(tag.get("stages", {}), **self.display_times.take())
+        stages["frame"] = stages.get("compute", 0.) + stages.get("convert", 0.) + stages.get("display", 0.)
+        stages["latency"] = time.perf_counter() - tag["requested"] # from the slider move to the frame on screen
+        cached = "stages" not in tag
+        self.timings.record(tag["effect"], stages, level=tag["level"], apply=tag["apply"] is not None, cached=cached,
+                            shape=list(shape))
+        if tag["apply"] is None:
+            now = time.perf_counter()
+            self.frame_times.append(now)
+            while now - self.frame_times[0] > 2.:
+                self.frame_times.popleft()
+
+        summary = self.timings.summary(tag["effect"])
+        frames = len(self.frame_times)
+        fps = (frames-1) / (self.frame_times[-1] - self.frame_times[0]) if frames > 1 and self.frame_times[-1] > self.frame_times[0] else 0.
+        message = "%s: frame %.1f ms (mean %.1f, p95 %.1f)  %.1f fps  |  " % (
+                  tag["effect"], stages["frame"]*1000, summary["frame"]["mean"]*1000, summary["frame"]["p95"]*1000, fps)
+        message += "cached" if cached else "  ".join("%s %.1f" % (name, stages[name]*1000)
+                                                     for name in ("grid", "prefilter", "sample", "copy", "filter", "clip", "stack", "convert", "display")
+                                                     if name in stages) + " ms"
+        self.window.statusbar.showMessage(message)
+
+    def show_image(self, image, level=0):
+        # converts the image into the reused uint8 buffer, wraps it into a QImage without copying and swaps the
+        # pixmap of the scene item. the view is only fitted again when the size of the image changes.
+        with timings.stage("convert", self.display_times):
+            if image.dtype == np.uint8 and image.flags.c_contiguous:
+                buffer = image
+            else:
+                if self.view_buffer is None or self.view_buffer.shape != image.shape:
+                    self.view_buffer = np.empty(image.shape, dtype=np.uint8)
+                    self.view_scratch = np.empty(image.shape, dtype=np.float32)
+                buffer = self.view_buffer
+                if image.dtype == np.uint8:
+                    np.copyto(buffer, image)
+                else:
+                    np.multiply(image, 255, out=self.view_scratch, casting="unsafe")
+                    np.clip(self.view_scratch, 0, 255, out=self.view_scratch)
+                    np.rint(self.view_scratch, out=buffer, casting="unsafe")
+
+        with timings.stage("display", self.display_times):
+            M, N = buffer.shape[:2]
+            self.image_item.setPixmap(QPixmap.fromImage(to_qimage(buffer))) # the pixmap holds a copy, the buffer can be reused
+            self.image_item.setScale(2**level) # keeps scene coordinates in full resolution pixels
+
+            view_size = (M * 2**level, N * 2**level)
+            if view_size != self.view_size:
+                self.view_size = view_size
+                self.scene.setSceneRect(self.image_item.sceneBoundingRect())
+                self.window.graphicsView.fitInView(self.image_item, Qt.KeepAspectRatio)
+
+    def clear_image_view(self):
+        self.image_item.setPixmap(QPixmap())
+        self.view_size = None
+
+    def set_image(self, image):
+        self.image = image
+        self.image_version += 1
+        self.pyramid = None if image is None else model.build_pyramid(image)
+
+    def preview_level(self):
+        # coarsest pyramid level that still has at least as many pixels as the view shows
+        view = self.window.graphicsView.viewport()
+        ratio = view.devicePixelRatioF()
+        M, N = self.image.shape[:2]
+        display_scale = min(view.width()*ratio/N, view.height()*ratio/M)
+        level = 0
+        while level+1 < len(self.pyramid) and 0.5**(level+1) >= display_scale:
+            level += 1
+        return level
+
+    def commit_image(self, label, image, effect_name=None, parameters=None):
+        self.set_image(image)
+        # added to the history, the recipe allows recomputing the image if its snapshot gets evicted
+        second_image = self.persmap_image if effect_name=="pers_mapping" else None
+        self.history.push(label, self.image, effect_name, parameters, second_image)
+        self.window.undo_button.setEnabled(True)
 
     def get_default_parameters(self):
-        parameters = {"fisheye": {"x": 0, "y": 0, "sigma": 1.0}, 
-                      "swirl": {"x": 0, "y": 0, "sigma": 0.01, "magnitude":0},
-                      "waves": {"amplitude": 0.1, "frequency": 0.1, "phase": 0},
-                      "cylinder": {"angle": 0.0},
-                      "radial_blur": {"sigma": 0.1},
-                      "pers_mapping": {"x1":0, "y1":0, "x2":0, "y2":0, "x3":0, "y3":0, "x4":0, "y4":0},
-                      "square_eye": {"x": 0, "y": 0, "sigma": 1.0, "p_value":0.1},
-                      "median": {"size": 3.0},
-                      "gaussian": {"radius": 2.0},
-                      "bilateral": {"sigma": 100, "rho": 50},
-                      "mean": {"size": 3.0},}
-        return parameters
+        return copy.deepcopy(model.DEFAULT_PARAMETERS)
 
     # disable buttons and input widgets
     def disable_buttons(self, buttons):
@@ -520,72 +787,132 @@ class MyApplication():
 
     @Slot()
     def load_button_event(self, graphicsView):
-        w = self.window
         self.image_file_name = QFileDialog.getOpenFileName(self.window, "Open Image", ".", "Image Files (*.png *.jpg *.bmp)")
         
         if self.image_file_name[0] != "":
-
-            reader = QImageReader(self.image_file_name[0])
-            reader.setAutoTransform(True)
-            new_image = reader.read()
-            if (new_image.isNull()):
-                print("Image not found")
-
-            self.scene = QGraphicsScene()
-            pixmap = QPixmap.fromImage(new_image)
-
-            self.scene.addPixmap(pixmap)
-            graphicsView.setScene(self.scene)
+            # decoded in the background, the main view shows a draft of a jpeg until the full image is decoded
+            target = graphicsView.accessibleName()
+            self.load_requests[target] += 1
+            tag = {"target": target, "file": self.image_file_name[0], "request": self.load_requests[target],
+                   "started": time.perf_counter()}
+            draft_size = None
+            if target == "graphicsView":
+                viewport = graphicsView.viewport().size()
+                draft_size = (viewport.width(), viewport.height())
+            self.window.statusbar.showMessage("Loading %s" % os.path.basename(tag["file"]))
+            self.threadpool.start(partial(load_image, self.loader_signals, tag["file"], tag, draft_size))
+
+    def is_latest_load(self, tag):
+        return tag["request"] == self.load_requests[tag["target"]]
+
+    def show_draft(self, draft, tag):
+        if self.is_latest_load(tag):
+            image, level = draft
+            self.show_image(image, level)
+
+    def show_load_progress(self, fraction, tag):
+        if self.is_latest_load(tag):
+            self.window.statusbar.showMessage("Loading %s: %d%%" % (os.path.basename(tag["file"]), 100*fraction))
+
+    def image_load_failed(self, message, tag):
+        if self.is_latest_load(tag):
+            print("Image not found")
+            self.window.statusbar.showMessage("Could not load %s: %s" % (os.path.basename(tag["file"]), message))
+
+    def image_loaded(self, image, tag):
+        if not self.is_latest_load(tag):
+            return
+        w = self.window
+        self.window.statusbar.showMessage("Loaded %s, %dx%d in %.2fs" % (os.path.basename(tag["file"]), image.shape[1],
+                                          image.shape[0], time.perf_counter() - tag["started"]))
+
+        if tag["target"]=="graphicsView":
+            self.set_image(image)
+            self.show_image(self.image)
+            if len(self.history)==1:
+                self.history.pop()
+            self.history.push("original image", self.image)
+            #plt.imshow(self.image, cmap="gray")
+            #plt.show()
+            #print(self.image.shape)
+
+            # enable the buttons that were disabled in the beginning
+            self.enable_buttons([w.save_button, w.reset_button,
+                                 w.fisheye_apply_button, w.swirl_apply_button,
+                                 w.waves_apply_button, w.cylinder_apply_button,
+                                 w.radial_apply_button,
+                                 w.square_eye_apply_button,
+                                 w.gaussian_apply_button, w.median_apply_button,
+                                 w.mean_apply_button, w.bilateral_apply_button])
+
+            self.set_parameter_limits()
+
+        elif tag["target"]=="persmap_graphicsView":
+            graphicsView = w.persmap_graphicsView
+            scene = QGraphicsScene()
+            scene.addPixmap(QPixmap.fromImage(to_qimage(np.ascontiguousarray(model.to_uint8(image)))))
+            graphicsView.setScene(scene)
             item = graphicsView.items()
             graphicsView.fitInView(item[0],Qt.KeepAspectRatio)
 
-            if graphicsView.accessibleName()=="graphicsView":
-                #self.image = self.image_read(self.image_file_name[0], pilmode="RGB") / 255.0
-                self.image = Image.open(self.image_file_name[0])
-                self.image = np.array(self.image) / 255.0
-                if len(self.images_stack)==1:
-                    self.images_stack.pop()
-                self.images_stack.append(("original image",self.image))
-                #plt.imshow(self.image, cmap="gray")
-                #plt.show()
-                #print(self.image.shape)
-
-                # enable the buttons that were disabled in the beginning
-                self.enable_buttons([w.save_button, w.reset_button,
-                                     w.fisheye_apply_button, w.swirl_apply_button,
-                                     w.waves_apply_button, w.cylinder_apply_button,
-                                     w.radial_apply_button,
-                                     w.square_eye_apply_button,
-                                     w.gaussian_apply_button, w.median_apply_button,
-                                     w.mean_apply_button, w.bilateral_apply_button])
-
-                self.set_parameter_limits()
-
-            elif graphicsView.accessibleName()=="persmap_graphicsView":
-                self.persmap_image = Image.open(self.image_file_name[0])
-                self.persmap_image = np.array(self.persmap_image) / 255.0
-                self.enable_buttons([w.persmap_apply_button])
+            self.persmap_image = image
+            self.persmap_version += 1
+            self.enable_buttons([w.persmap_apply_button])
 
 
     @Slot()
     def save_button_event(self):
-        file_name_to_save = QFileDialog.getSaveFileName(self.window, "Open Image", ".", "Image Files (*.png *.jpg *.bmp)")[0]
-
-        extension_list = ["png", "jpg", "jpeg"]
-        if any(substring in file_name_to_save for substring in extension_list) == False:
-            file_name_to_save = file_name_to_save + ".png"
-
-        image_to_be_saved = self.image.copy()
-        if np.issubdtype(image_to_be_saved.dtype, np.floating):
-            image_to_be_saved = (self.image*255).astype(np.uint8)
-
-        self.image_write(image_to_be_saved, file_name_to_save)
+        filters = [f[0] for f in SAVE_FORMATS.values()]
+        file_name_to_save, selected_filter = QFileDialog.getSaveFileName(self.window, "Save Image", ".", ";;".join(filters))
+        if file_name_to_save == "":
+            return
+
+        extension = os.path.splitext(file_name_to_save)[1].lower()
+        if SAVE_EXTENSIONS.get(extension, extension) not in SAVE_FORMATS:
+            # the format of the selected filter, png by default
+            extension = next((e for e, f in SAVE_FORMATS.items() if f[0] == selected_filter), ".png")
+            file_name_to_save = file_name_to_save + extension
+        extension = SAVE_EXTENSIONS.get(extension, extension)
+
+        setting = self.ask_save_setting(extension)
+        if setting is None:
+            return
+        self.save_settings[extension] = setting
+
+        # encoded in the background, editing can go on meanwhile
+        tag = {"file": file_name_to_save, "started": time.perf_counter()}
+        self.window.statusbar.showMessage("Saving %s" % os.path.basename(file_name_to_save))
+        self.threadpool.start(partial(save_image, self.saver_signals, self.image, file_name_to_save,
+                                      save_options(extension, setting), tag))
+
+    def ask_save_setting(self, extension):
+        # the compression level or quality of the format, None if the dialog is cancelled
+        label = SAVE_FORMATS[extension][1]
+        if label is None:
+            return 0
+        if isinstance(SAVE_FORMATS[extension][2], list):
+            choices = SAVE_FORMATS[extension][2]
+            current = choices.index(self.save_settings.get(extension, choices[0]))
+            setting, ok = QInputDialog.getItem(self.window, "Save Image", label, choices, current, False)
+        else:
+            minimum, maximum, default = SAVE_FORMATS[extension][2:]
+            setting, ok = QInputDialog.getInt(self.window, "Save Image", label,
+                                              self.save_settings.get(extension, default), minimum, maximum)
+        return setting if ok else None
+
+    def image_saved(self, tag):
+        self.window.statusbar.showMessage("Saved %s in %.2fs" % (os.path.basename(tag["file"]),
+                                                               time.perf_counter() - tag["started"]))
+
+    def image_save_failed(self, message, tag):
+        self.window.statusbar.showMessage("Could not save %s" % os.path.basename(tag["file"]))
+        QMessageBox.warning(self.window, "Save Image", "Could not save %s:\n%s" % (tag["file"], message))
 
     @Slot()
     def reset_button_event(self, image="main_image"):
         if image=="main_image":
-            self.window.graphicsView.setScene(None)
-            self.image = None
+            self.clear_image_view()
+            self.set_image(None)
             self.disable_buttons([self.window.save_button, self.window.reset_button, self.window.undo_button,
                                   self.window.fisheye_apply_button, self.window.swirl_apply_button,
                                   self.window.waves_apply_button, self.window.cylinder_apply_button,
@@ -600,24 +927,13 @@ class MyApplication():
 
     @Slot()
     def undo_button_event(self):
-        if len(self.images_stack)>1:
-            self.images_stack.pop()
-            self.image = self.images_stack[-1][1].copy()
-            view_image = self.images_stack[-1][1].copy()  # To view image on the GraphicView
-
-            if np.issubdtype(view_image.dtype, np.floating):
-                view_image = (view_image*255).astype(np.uint8)
-
-            view_image = ImageQt.ImageQt( Image.fromarray(view_image) ) # convert view_image to qimage
-            pixmap = QPixmap.fromImage(view_image)
-            self.scene = QGraphicsScene()
-            self.scene.addPixmap(pixmap)
-            self.window.graphicsView.setScene(self.scene)
-            item = self.window.graphicsView.items()
-            self.window.graphicsView.fitInView(item[0],Qt.KeepAspectRatio)
-
-            #print("----------------------->",len(self.images_stack))
-            if len(self.images_stack)==1:
+        if len(self.history)>1:
+            self.history.pop()
+            self.set_image(self.history.current())
+            self.show_image(self.image)  # To view image on the GraphicView
+
+            #print("----------------------->",len(self.history))
+            if len(self.history)==1:
                 self.disable_buttons([self.window.undo_button])
 
 
@@ -639,53 +955,43 @@ class MyApplication():
 
     @Slot()
     def fisheye_effect_apply_button_event(self):
-        self.image = self.preview_image.copy()
-        self.images_stack.append(("fish eye effect", self.image))  # added to the stack
+        self.update_image("fisheye", "fish eye effect")  # rendered in full resolution, added to the stack when done
 
         for widget in self.fisheye_effect_parameters:
             widget.setEnabled(False)
         self.window.fisheye_apply_button.setEnabled(False)
-        self.window.undo_button.setEnabled(True)
 
     @Slot()
     def swirl_effect_apply_button_event(self):
-        self.image = self.preview_image.copy()
-        self.images_stack.append(("swirl effect", self.image))  # added to the stack
+        self.update_image("swirl", "swirl effect")  # rendered in full resolution, added to the stack when done
 
         for widget in self.swirl_effect_parameters:
             widget.setEnabled(False)
         self.window.swirl_apply_button.setEnabled(False)
-        self.window.undo_button.setEnabled(True)
 
     @Slot()
     def waves_effect_apply_button_event(self):
-        self.image = self.preview_image.copy()
-        self.images_stack.append(("waves effect", self.image))  # added to the stack
+        self.update_image("waves", "waves effect")  # rendered in full resolution, added to the stack when done
 
         for widget in self.waves_effect_parameters:
             widget.setEnabled(False)
         self.window.waves_apply_button.setEnabled(False)
-        self.window.undo_button.setEnabled(True)
 
     @Slot()
     def cylinder_effect_apply_button_event(self):
-        self.image = self.preview_image.copy()
-        self.images_stack.append(("cylinder effect", self.image))  # added to the stack
+        self.update_image("cylinder", "cylinder effect")  # rendered in full resolution, added to the stack when done
 
         for widget in self.cylinder_effect_parameters:
             widget.setEnabled(False)
         self.window.cylinder_apply_button.setEnabled(False)
-        self.window.undo_button.setEnabled(True)
 
     @Slot()
     def radial_blur_effect_apply_button_event(self):
-        self.image = self.preview_image.copy()
-        self.images_stack.append(("radial blur effect", self.image))  # added to the stack
+        self.update_image("radial_blur", "radial blur effect")  # rendered in full resolution, added to the stack when done
 
         for widget in self.radial_blur_effect_parameters:
             widget.setEnabled(False)
         self.window.radial_apply_button.setEnabled(False)
-        self.window.undo_button.setEnabled(True)
 
     @Slot()
     def pers_mapping_select_button_event(self, x, y):
@@ -694,88 +1000,130 @@ class MyApplication():
 
     @Slot()
     def pers_mapping_apply_button_event(self):
-        self.image = self.preview_image.copy()
-        self.images_stack.append(("pers mapping effect", self.image))  # added to the stack
+        self.update_image("pers_mapping", "pers mapping effect")  # rendered in full resolution, added to the stack when done
 
         for widget in self.pers_mapping_parameters:
             widget.setEnabled(False)
         self.window.persmap_apply_button.setEnabled(False)
-        self.window.undo_button.setEnabled(True)
 
     @Slot()
     def square_eye_apply_button_event(self):
-        self.image = self.preview_image.copy()
-        self.images_stack.append(("square eye effect", self.image))  # added to the stack
+        self.update_image("square_eye", "square eye effect")  # rendered in full resolution, added to the stack when done
 
         for widget in self.square_eye_effect_parameters:
             widget.setEnabled(False)
         self.window.square_eye_apply_button.setEnabled(False)
-        self.window.undo_button.setEnabled(True)
 
     @Slot()
     def gaussian_blur_apply_button_event(self):
-        self.image = self.preview_image.copy()
-        self.images_stack.append(("gaussian blur effect", self.image))  # added to the stack
+        self.update_image("gaussian", "gaussian blur effect")  # rendered in full resolution, added to the stack when done
 
         for widget in self.gaussian_blur_parameters:
             widget.setEnabled(False)
         self.window.gaussian_apply_button.setEnabled(False)
-        self.window.undo_button.setEnabled(True)
 
     @Slot()
     def median_blur_apply_button_event(self):
-        self.image = self.preview_image.copy()
-        self.images_stack.append(("median blur effect", self.image))  # added to the stack
+        self.update_image("median", "median blur effect")  # rendered in full resolution, added to the stack when done
 
         for widget in self.median_blur_parameters:
             widget.setEnabled(False)
         self.window.median_apply_button.setEnabled(False)
-        self.window.undo_button.setEnabled(True)
 
     @Slot()
     def mean_blur_apply_button_event(self):
-        self.image = self.preview_image.copy()
-        self.images_stack.append(("mean blur effect", self.image))  # added to the stack
+        self.update_image("mean", "mean blur effect")  # rendered in full resolution, added to the stack when done
 
         for widget in self.mean_blur_parameters:
             widget.setEnabled(False)
         self.window.mean_apply_button.setEnabled(False)
-        self.window.undo_button.setEnabled(True)
 
     @Slot()
     def bilateral_filter_apply_button_event(self):
-        self.image = self.preview_image.copy()
-        self.images_stack.append(("bilateral filter effect", self.image))  # added to the stack
+        self.update_image("bilateral", "bilateral filter effect")  # rendered in full resolution, added to the stack when done
 
         for widget in self.gaussian_blur_parameters:
             widget.setEnabled(False)
         self.window.gaussian_apply_button.setEnabled(False)
-        self.window.undo_button.setEnabled(True)
 
 
-    def image_read(self, file_name, pilmode='RGB', arrtype=np.float):
+    def image_read(self, file_name, pilmode='RGB', arrtype=None):
         """
         pilmode: str
             for luminance / intesity images use 'L'
             for RGB color images use 'RGB'
         arrtype: numpy dtype
-            use np.float, np.uint8, ...
+            use np.float32, np.uint8, ..., defaults to the working precision
         """
-        return imageio.imread(file_name, pilmode=pilmode).astype(arrtype)
+        import imageio
+        return model.to_working_precision(imageio.imread(file_name, pilmode=pilmode), arrtype)
 
     def image_write(self, image, file_name, arrtype=np.uint8):
         #print(image.dtype)
+        import imageio
         imageio.imwrite(file_name, np.array(image).astype(arrtype))
 
 
+def parse_preview_orders(values):
+    # "3" sets the order of every effect, "swirl=3" the one of an effect
+    orders = {}
+    for value in values:
+        effect_name, _, order = value.rpartition("=")
+        if effect_name and effect_name not in PREVIEW_ORDERS:
+            raise ValueError("No preview order for effect: %s" % effect_name)
+        if int(order) not in (0, 1, 2, 3, 4, 5):
+            raise ValueError("Spline order out of range: %s" % order)
+        orders.update({name: int(order) for name in ([effect_name] if effect_name else PREVIEW_ORDERS)})
+    return orders
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Image Processing Tool")
+    parser.add_argument("--precision", choices=list(model.PRECISIONS), default="float32",
+                        help="working precision of the images, uint8 runs the filters that support it natively")
+    parser.add_argument("--history-memory", type=int, default=512,
+                        help="memory budget of the undo history in MB, older snapshots are spilled to disk")
+    parser.add_argument("--history-disk", type=int, default=4096,
+                        help="disk budget of the undo history in MB, older snapshots are recomputed when needed")
+    parser.add_argument("--history-compression", choices=["lossless", "uint8"], default="lossless",
+                        help="lossless or 8 bit quantized snapshots of the undo history")
+    parser.add_argument("--result-cache", type=int, default=256,
+                        help="memory for rendered results in MB, revisited parameters are shown without recomputing them")
+    parser.add_argument("--executor", choices=executors.EXECUTORS, default="qt",
+                        help="runs the channels and tiles of an effect on a qt or python thread pool, a process pool or inline")
+    parser.add_argument("--workers", type=int, default=None, help="size of the pool, defaults to the number of cores")
+    parser.add_argument("--preview-order", nargs="+", default=[], metavar="[EFFECT=]ORDER",
+                        help="spline order of the previews of the warps and perspective mapping (0 nearest, 1 bilinear, "
+                             "3 cubic), for all of them or e.g. swirl=3, bilinear by default")
+    parser.add_argument("--startup-time", action="store_true",
+                        help="prints the time to the first window split into its stages and quits")
+    parser.add_argument("--timing-log", default=None,
+                        help="appends the stage times of every shown frame to this file, one json object per line")
+    return parser.parse_known_args()
+
+
 if __name__ == "__main__":
 
-    app = QtWidgets.QApplication(sys.argv)
+    args, qt_args = parse_arguments()
+    model.set_working_precision(args.precision)
+    imported = time.perf_counter()
+
+    app = QtWidgets.QApplication(sys.argv[:1] + qt_args)
+    created = time.perf_counter()
 
-    my_app = MyApplication()
+    executor = executors.make_executor(args.executor, args.workers, model.set_working_precision, (args.precision,))
+    my_app = MyApplication(history_options={"memory_budget": args.history_memory*2**20,
+                                            "disk_budget": args.history_disk*2**20,
+                                            "compression": args.history_compression},
+                           executor=executor, result_cache_size=args.result_cache*2**20, timing_log=args.timing_log,
+                           preview_orders=parse_preview_orders(args.preview_order))
 
     with open("style.qss", "r") as f:
         _style = f.read()
         app.setStyleSheet(_style)
 
+    if args.startup_time:
+        startup_timer = StartupTimer([("imports", imported), ("application", created), ("window", time.perf_counter())],
+                                     quit=True)
+        my_app.window.installEventFilter(startup_timer)
+
     app.exec()
\ No newline at end of file
@@ -0,0 +1,69 @@
+import os
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor
+
+EXECUTORS = ("qt", "thread", "process", "inline")
+
+class InlineExecutor(Executor):
+    # runs every job in the calling thread when it is submitted, for debugging and single core machines
+    def __init__(self, initializer=None, initargs=()):
+        if initializer is not None:
+            initializer(*initargs)
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+class QtExecutor(Executor):
+    # runs the jobs on a QThreadPool of its own
+    def __init__(self, max_workers=None, initializer=None, initargs=()):
+        from PySide6.QtCore import QThreadPool
+        self.threadpool = QThreadPool()
+        if max_workers:
+            self.threadpool.setMaxThreadCount(max_workers)
+        if initializer is not None:
+            initializer(*initargs) # the jobs share the process and its module state
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+
+        self.threadpool.start(run)
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        if cancel_futures:
+            self.threadpool.clear()
+        if wait:
+            self.threadpool.waitForDone()
+
+def make_executor(kind="qt", workers=None, initializer=None, initargs=()):
+    # executor of the per-channel and per-tile jobs (and of the images of a batch)
+    # workers defaults to the number of cores, the initializer runs in every process of a process pool
+    if kind not in EXECUTORS:
+        raise ValueError("Unknown executor: %s" % kind)
+    workers = workers or os.cpu_count()
+    if kind == "qt":
+        return QtExecutor(workers, initializer, initargs)
+    elif kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+    elif kind == "process":
+        return ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+    return InlineExecutor(initializer, initargs)
+
+def map_jobs(executor, function, items):
+    # results of function on every item, exceptions of a job are raised after all jobs have finished
+    futures = [executor.submit(function, item) for item in items]
+    for future in futures:
+        future.exception()
+    return [future.result() for future in futures]
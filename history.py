@@ -0,0 +1,194 @@
+import os
+import zlib
+import shutil
+import tempfile
+
+import numpy as np
+
+import model
+
+class HistoryEntry():
+    def __init__(self, label, effect_name, parameters, second_image):
+        self.label = label
+        # recipe used to recompute the image from the previous entry after its snapshot has been evicted
+        self.effect_name = effect_name
+        self.parameters = parameters
+        self.second_image = second_image
+        self.shape = None
+        self.dtype = None
+        self.stored_dtype = None
+        self.is_diff = False      # snapshot holds the xor with the previous snapshot
+        self.data = None          # compressed snapshot while it is kept in memory
+        self.path = None          # file of the compressed snapshot after it has been spilled to disk
+        self.nbytes = 0
+
+    @property
+    def replayable(self):
+        return self.effect_name is not None
+
+class History():
+    # undo history with a memory budget
+    # snapshots are compressed (lossless or quantized to uint8), optionally stored as the difference to the previous
+    # snapshot, spilled to a temporary directory when the memory budget is exceeded and dropped when the disk budget
+    # is exceeded. dropped states are recomputed by replaying the recorded effects from the nearest stored snapshot.
+    def __init__(self, memory_budget=512*2**20, disk_budget=4*2**30, compression="lossless", diffs=True,
+                 checkpoint_interval=8, compression_level=1):
+        if compression not in ("lossless", "uint8"):
+            raise ValueError("Unknown compression: %s" % compression)
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+        self.compression = compression
+        self.diffs = diffs
+        self.checkpoint_interval = checkpoint_interval # every n-th snapshot is stored without a diff and never dropped
+        self.compression_level = compression_level
+        self.entries = []
+        self.top = None           # the latest image is also kept uncompressed
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self.directory = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def labels(self):
+        return [e.label for e in self.entries]
+
+    def push(self, label, image, effect_name=None, parameters=None, second_image=None):
+        entry = HistoryEntry(label, effect_name, parameters, second_image)
+        stored = np.ascontiguousarray(self.quantize(image))
+        entry.shape, entry.dtype, entry.stored_dtype = image.shape, image.dtype, stored.dtype
+
+        previous = self.entries[-1] if self.entries else None
+        if (self.diffs and previous is not None and not self.is_checkpoint(len(self.entries))
+                and self.has_snapshot(previous)
+                and previous.shape == entry.shape and previous.stored_dtype == entry.stored_dtype):
+            # xor of the raw bytes is lossless and compresses to almost nothing where the image did not change.
+            # taken against the stored bytes of the previous snapshot, the top image may have been replayed
+            previous_stored = self.stored(len(self.entries)-1)
+            stored = np.bitwise_xor(stored.view(np.uint8), np.ascontiguousarray(previous_stored).view(np.uint8))
+            entry.is_diff = True
+
+        entry.data = zlib.compress(stored.data, self.compression_level)
+        entry.nbytes = len(entry.data)
+        self.memory_bytes += entry.nbytes
+        self.entries.append(entry)
+        self.top = image
+        self.enforce_budget()
+
+    def pop(self):
+        entry = self.entries.pop()
+        self.release(entry)
+        self.top = None
+        self.top = self.get(len(self.entries)-1) if self.entries else None
+        return entry
+
+    def current(self):
+        return self.top
+
+    def get(self, idx):
+        # image of the idx-th entry, recomputed if its snapshot has been dropped
+        if idx == len(self.entries)-1 and self.top is not None:
+            return self.top
+        entry = self.entries[idx]
+        if self.has_snapshot(entry):
+            return self.restore(entry, self.stored(idx))
+
+        base = idx
+        while not self.has_snapshot(self.entries[base]):
+            base -= 1
+        image = self.restore(self.entries[base], self.stored(base))
+        # consecutive warps are replayed in one resampling pass
+        recipe = [(e.effect_name, e.parameters, e.second_image) for e in self.entries[base+1:idx+1]]
+        return model.apply_recipe(image, recipe)
+
+    def clear(self):
+        while self.entries:
+            self.release(self.entries.pop())
+        self.top = None
+
+    def close(self):
+        self.clear()
+        if self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self.directory = None
+
+    ####################################################################################
+
+    def is_checkpoint(self, idx):
+        return idx % self.checkpoint_interval == 0
+
+    def has_snapshot(self, entry):
+        return entry.data is not None or entry.path is not None
+
+    def quantize(self, image):
+        if self.compression == "uint8":
+            return model.to_uint8(image)
+        return image
+
+    def restore(self, entry, stored):
+        if self.compression == "uint8":
+            return model.to_working_precision(stored, entry.dtype)
+        return stored
+
+    def stored(self, idx):
+        # the stored (possibly quantized) array of the idx-th entry, resolving diffs
+        entry = self.entries[idx]
+        if entry.data is not None:
+            data = entry.data
+        else:
+            with open(entry.path, "rb") as f:
+                data = f.read()
+        stored = np.frombuffer(zlib.decompress(data), dtype=np.uint8)
+        if entry.is_diff:
+            stored = np.bitwise_xor(stored, self.stored(idx-1).view(np.uint8).reshape(-1))
+        return stored.view(entry.stored_dtype).reshape(entry.shape)
+
+    def release(self, entry):
+        if entry.data is not None:
+            self.memory_bytes -= entry.nbytes
+            entry.data = None
+        if entry.path is not None:
+            self.disk_bytes -= entry.nbytes
+            os.remove(entry.path)
+            entry.path = None
+
+    def enforce_budget(self):
+        # spill the oldest snapshots kept in memory to disk, the latest one always stays in memory
+        for idx, entry in enumerate(self.entries[:-1]):
+            if self.memory_bytes <= self.memory_budget:
+                break
+            if entry.data is not None:
+                self.spill(idx)
+
+        # drop the oldest spilled snapshots that can be recomputed
+        for idx, entry in enumerate(self.entries[:-1]):
+            if self.disk_bytes <= self.disk_budget:
+                break
+            if entry.path is not None and entry.replayable and not self.is_checkpoint(idx):
+                self.drop(idx)
+
+    def spill(self, idx):
+        entry = self.entries[idx]
+        if self.directory is None:
+            self.directory = tempfile.mkdtemp(prefix="image-processing-history-")
+        entry.path = os.path.join(self.directory, "%d-%d.snapshot" % (id(entry), idx))
+        with open(entry.path, "wb") as f:
+            f.write(entry.data)
+        entry.data = None
+        self.memory_bytes -= entry.nbytes
+        self.disk_bytes += entry.nbytes
+
+    def drop(self, idx):
+        entry = self.entries[idx]
+        following = self.entries[idx+1] if idx+1 < len(self.entries) else None
+        if following is not None and following.is_diff and self.has_snapshot(following):
+            # the next snapshot can not be resolved without this one anymore, store it in full
+            data = zlib.compress(np.ascontiguousarray(self.stored(idx+1)).data, self.compression_level)
+            in_memory = following.data is not None
+            self.release(following)
+            following.data, following.nbytes, following.is_diff = data, len(data), False
+            self.memory_bytes += following.nbytes
+            if not in_memory:
+                self.spill(idx+1)
+        self.release(entry)
@@ -1,11 +1,169 @@
 import numpy as np
-import imageio
-import matplotlib.pyplot as plt
-import scipy.ndimage as img
-from PIL import Image
-from PIL import Image, ImageFilter 
-from scipy.ndimage import median_filter as scipy_median_filter
-import cv2
+import importlib
+import threading
+from functools import partial
+from collections import OrderedDict
+
+from timings import stage
+
+class LazyModule():
+    # imports the module on first use, scipy takes longer to import than the window takes to appear.
+    # matplotlib (debug plots) and cv2 (opencv bilateral filter) are imported where they are used.
+    def __init__(self, name):
+        self.name = name
+        self.module = None
+
+    def __getattr__(self, attribute):
+        if self.module is None:
+            self.module = importlib.import_module(self.name)
+        return getattr(self.module, attribute)
+
+img = LazyModule("scipy.ndimage")
+
+def preload():
+    # imports the modules every effect needs, called in the background once the window is shown
+    img.map_coordinates
+
+class LRUCache():
+    # thread-safe least-recently-used cache bounded by entry count and/or total bytes
+    def __init__(self, max_entries=None, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key][0]
+            self.misses += 1
+            return default
+
+    def put(self, key, value, nbytes=0):
+        with self.lock:
+            if key in self.entries:
+                self.nbytes -= self.entries.pop(key)[1]
+            self.entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            while self.entries and ((self.max_entries is not None and len(self.entries) > self.max_entries) or
+                                    (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+                _, (_, size) = self.entries.popitem(last=False)
+                self.nbytes -= size
+
+    def __contains__(self, key):
+        # does not count as a hit or a miss
+        with self.lock:
+            return key in self.entries
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+####################################################################################
+
+# working precision of the images, float images hold values in [0,1] and uint8 images in [0,255]
+# filters that support it run natively on uint8, the other effects compute in float32 and round back
+PRECISIONS = {"float32": np.float32, "float64": np.float64, "uint8": np.uint8}
+WORKING_DTYPE = np.dtype(np.float32)
+
+def set_working_precision(precision):
+    global WORKING_DTYPE
+    WORKING_DTYPE = np.dtype(PRECISIONS[precision])
+
+def coordinate_dtype():
+    # coordinate maps only need double precision if the images have it
+    return np.dtype(np.float64) if WORKING_DTYPE == np.float64 else np.dtype(np.float32)
+
+def to_working_precision(arr, dtype=None):
+    # converts a decoded image (or an image of another precision) to the working precision
+    dtype = np.dtype(WORKING_DTYPE if dtype is None else dtype)
+    arr = np.asarray(arr)
+    if arr.dtype == dtype:
+        return arr
+    if arr.dtype == np.uint8 and dtype.kind == "f":
+        return np.multiply(arr, 1/255, dtype=dtype)
+    if arr.dtype.kind in "ui" and dtype.kind == "f":
+        return np.multiply(arr, 1/np.iinfo(arr.dtype).max, dtype=dtype)
+    if arr.dtype.kind == "f" and dtype == np.uint8:
+        return np.rint(np.clip(arr, 0, 1) * 255).astype(np.uint8)
+    return arr.astype(dtype, copy=False)
+
+def to_uint8(arr):
+    # rounds instead of truncating, float32 values like 51/255*255 land just below the integer
+    return to_working_precision(arr, np.uint8)
+
+def as_float(arrF):
+    # input of the effects that can not run on uint8 data
+    return arrF if arrF.dtype.kind == "f" else to_working_precision(arrF, coordinate_dtype())
+
+def clip(arrG, dtype):
+    # clips a float result to [0,1] and converts it to dtype
+    with stage("clip"):
+        return to_working_precision(np.clip(arrG, 0, 1), dtype)
+
+####################################################################################
+
+GRID_CACHE_SIZE = 8
+GRID_CACHE_BYTES = 768*2**20 # a float32 grid of a 24 MP image takes 192 MB, the radial blur also keeps two polar maps
+_grid_cache = LRUCache(max_entries=GRID_CACHE_SIZE, max_bytes=GRID_CACHE_BYTES)
+
+def index_grid(shape, dtype=None):
+    # read-only (2,M,N) array holding the row (v) and column (u) index of every pixel
+    # shared by all effects working on images of the same shape, never modify it in place
+    shape = (int(shape[0]), int(shape[1]))
+    dtype = coordinate_dtype() if dtype is None else np.dtype(dtype)
+    matX = _grid_cache.get((shape, dtype))
+    if matX is None:
+        matX = np.indices(shape).astype(dtype)
+        matX.flags.writeable = False
+        _grid_cache.put((shape, dtype), matX, matX.nbytes)
+    return matX
+
+def image_key(arrF):
+    # identifies the buffer of an image for caches of results derived from it. entries have to hold a reference to
+    # the image, so that its memory can not be reused by another image with the same key while they exist.
+    return (arrF.__array_interface__["data"][0], arrF.shape, arrF.strides, arrF.dtype.str)
+
+def clear_caches():
+    # forgets the grids, tables and polar images kept for the latest images, e.g. to measure the cost of a first run
+    for cache in (_grid_cache, _sat_cache, _polar_cache, _spline_cache):
+        cache.clear()
+
+def window_grid(shape, window=None, points=None):
+    # index grid of the whole image or of its window (r0, r1, c0, c1), used to build coordinate maps tile by tile
+    # coordinate builders can also be given the (2,M,N) points to map, e.g. the coordinates of a following warp
+    if points is not None:
+        return points
+    if window is None:
+        return index_grid(shape)
+    r0, r1, c0, c1 = window
+    matX = index_grid((r1-r0, c1-c0))
+    return matX + np.array([r0, c0], dtype=matX.dtype).reshape(2,1,1)
+
+def build_pyramid(arrF, min_size=64):
+    # levels[0] is arrF itself, every following level halves both sides by averaging 2x2 blocks
+    levels = [arrF]
+    while min(levels[-1].shape[:2]) // 2 >= min_size:
+        f = levels[-1]
+        M, N = (f.shape[0]//2)*2, (f.shape[1]//2)*2
+        f = f[:M, :N]
+        if f.dtype == np.uint8:
+            f = f.astype(np.uint16) # the sum of four pixels overflows uint8
+            levels.append(((f[0::2, 0::2] + f[1::2, 0::2] + f[0::2, 1::2] + f[1::2, 1::2] + 2) // 4).astype(np.uint8))
+        else:
+            levels.append((f[0::2, 0::2] + f[1::2, 0::2] + f[0::2, 1::2] + f[1::2, 1::2]) / 4)
+    return levels
+
+####################################################################################
 
 def delta1(r, sigma):
     return np.where(r < sigma, 1 - r/sigma, 0)
@@ -22,33 +180,83 @@ def delta4(r, sigma):
 def delta5(r, sigma):
     return np.exp(-0.5 * (r/sigma)**2)
 
-def fisheye_effect(arrF, vecC, sigma=100., dfct=delta1):
-    vecC = np.array(vecC).reshape(-1,1)
-    M, N = arrF.shape
-    u, v = np.meshgrid(np.arange(N), np.arange(M))
-    matX = np.vstack((v.flatten(), u.flatten())).astype(float) # u
+def apply_to_channel(f, arrF, params, i):
+    # job of one channel, a module level function so that it can be sent to other processes
+    return f(arrF[:,:,i], *params)
+
+SPLINE_CACHE_BYTES = 512*2**20
+_spline_cache = LRUCache(max_bytes=SPLINE_CACHE_BYTES)
+
+def spline_filter(arrF, order=3):
+    # spline coefficients of a channel, the prefilter map_coordinates runs on every call unless prefilter=False
+    arrF = as_float(arrF)
+    return img.spline_filter(arrF, order, output=arrF.dtype, mode="constant")
+
+def spline_key(arrF, order):
+    return image_key(arrF) + (order, coordinate_dtype())
+
+def spline_coefficients(arrF, order=3, mapper=map, cache=True):
+    # spline coefficients of every channel of arrF, cached for the latest images so that a warp whose parameters change
+    # only samples them again. a color image is prefiltered channel by channel through mapper(function, channels).
+    key = spline_key(arrF, order)
+    entry = _spline_cache.get(key) if cache else None
+    if entry is not None:
+        return entry[1]
+    with stage("prefilter"):
+        if arrF.ndim == 3:
+            coefficients = np.stack(list(mapper(partial(apply_to_channel, spline_filter, arrF, (order,)),
+                                                range(arrF.shape[2]))), axis=2)
+        else:
+            coefficients = spline_filter(arrF, order)
+    if cache:
+        coefficients.flags.writeable = False
+        _spline_cache.put(key, (arrF, coefficients), coefficients.nbytes)
+    return coefficients
+
+def sample(source, matX, order, dtype, i=None):
+    # samples a float image (order 0 or 1) or its spline coefficients (order 2 to 5) at matX, the i-th channel if given
+    with stage("sample"):
+        arrG = img.map_coordinates(source if i is None else source[:,:,i], matX, order=order, prefilter=False) # matX MUST be float
+    return clip(arrG, dtype)
+
+def warp(arrF, matX, mapper=map, order=3, cache=True):
+    # sample stage shared by all warps: matX holds the source coordinates of every output pixel
+    # a coordinate map is built once and reused for every channel of a color image, mapper(function, channels)
+    # can sample the channels in parallel. order 0 samples the nearest pixel, 1 bilinearly and 3 cubic splines,
+    # whose coefficients are cached unless cache is False.
+    source = spline_coefficients(arrF, order, mapper, cache) if order > 1 else as_float(arrF)
+    if arrF.ndim == 3:
+        channels = list(mapper(partial(sample, source, matX, order, arrF.dtype), range(arrF.shape[2])))
+        with stage("stack"):
+            return np.stack(channels, axis=2)
+    return sample(source, matX, order, arrF.dtype)
+
+####################################################################################
+
+def fisheye_coordinates(shape, vecC, sigma=100., dfct=delta1, window=None, points=None):
+    matX = window_grid(shape, window, points) # u
+    vecC = np.array(vecC, dtype=matX.dtype).reshape(2,1,1)
     matR = vecC - matX                      # vectors pointing to center # r = c-u
     dist = np.sqrt(np.sum(matR**2, axis=0)) # distances to center # ||r||
-    matX = matX + matR * dfct(dist, sigma)  # W(u,c,sigma)= u + r*delta
-    
-    arrG = img.map_coordinates(arrF, matX)  # matX MUST be float
-    arrG = arrG.reshape(M,N)
-    return np.clip(arrG,0,1)
+    return matX + matR * dfct(dist, sigma)  # W(u,c,sigma)= u + r*delta
+
+def fisheye_effect(arrF, vecC, sigma=100., dfct=delta1, order=3):
+    return warp(arrF, fisheye_coordinates(arrF.shape[:2], vecC, sigma, dfct), order=order)
 
 ####################################################################################
 
-def swirl_effect(arrF, vecC, sigma, magnitude):
-    M, N = arrF.shape
-    u, v = np.meshgrid(np.arange(N), np.arange(M))
-    matX = np.stack((v, u)).astype(float)
+def swirl_coordinates(shape, vecC, sigma, magnitude, window=None, points=None):
+    matX = window_grid(shape, window, points)
     
     # compute polar coordinates with respect to vecC
-    vecC = np.asarray(vecC).reshape(2,1,1)
+    vecC = np.asarray(vecC, dtype=matX.dtype).reshape(2,1,1)
     diff = matX - vecC 
     r = np.linalg.norm(diff, axis=0)
     angle = np.arctan2(diff[1], diff[0])
     
-    dist = r/r.max()
+    # the farthest pixel from the center is one of the image corners
+    corners = np.array([[0, 0, shape[0]-1, shape[0]-1], [0, shape[1]-1, 0, shape[1]-1]], dtype=matX.dtype)
+    dist = r/np.linalg.norm(corners - vecC[:,:,0], axis=0).max()
     gaussian = np.exp(- dist**2 / (2*(sigma**2)))
     
     angle += magnitude*gaussian
@@ -56,58 +264,63 @@ def swirl_effect(arrF, vecC, sigma, magnitude):
     # compute euclidian coordinates with respect to image zero
     matX = np.stack([r * np.cos(angle) , r * np.sin(angle)])
     matX += vecC
+    return matX
 
-    arrG = img.map_coordinates(arrF, matX) # matX MUST be float
-    arrG = arrG.reshape(M,N)
-    return np.clip(arrG, 0, 1)
+def swirl_effect(arrF, vecC, sigma, magnitude, order=3):
+    return warp(arrF, swirl_coordinates(arrF.shape[:2], vecC, sigma, magnitude), order=order)
 
 ####################################################################################
 
-def waves_effect(arrF, amplitude, frequency, phase):
-    M, N = arrF.shape
-    u, v = np.meshgrid(np.arange(N+amplitude[1]*2), np.arange(M+amplitude[0]*2))
-    matX = np.stack((v, u)).astype(float)
+def waves_shape(shape, amplitude):
+    # the output is larger than the input by the amplitude on every side
+    return (int(np.ceil(shape[0]+amplitude[0]*2)), int(np.ceil(shape[1]+amplitude[1]*2)))
+
+def waves_coordinates(shape, amplitude, frequency, phase, window=None, points=None):
+    matX = window_grid(waves_shape(shape, amplitude), window, points)
       
     # for j axis
     b = amplitude[1] * np.sin(matX[0]/frequency[1] + phase[1])
-    matX[1] += b - amplitude[1]
+    matX = np.stack((matX[0], matX[1] + b - amplitude[1]))
     
     # for i axis
     a = amplitude[0] * np.sin(matX[1]/frequency[0] + phase[0]) 
     matX[0] += a - amplitude[0]
-    
-    arrG = img.map_coordinates(arrF, matX) # matX MUST be float
-    arrG = arrG.reshape(matX.shape[1],matX.shape[2])
-    return np.clip(arrG, 0, 1)
+    return matX
+
+def waves_effect(arrF, amplitude, frequency, phase, order=3):
+    return warp(arrF, waves_coordinates(arrF.shape[:2], amplitude, frequency, phase), order=order)
 
 ####################################################################################
 
-def cylinder(arrF, angle_shift):
-    M, N = arrF.shape
-    u, v = np.meshgrid(np.arange(N), np.arange(M))
-    matX = np.stack((v, u)).astype(float)
+def cylinder_coordinates(shape, angle_shift, window=None, points=None):
+    M, N = shape
+    matX = window_grid(shape, window, points)
     
     # compute polar coordinates with respect to vecC
-    vecC = np.array([arrF.shape[0]//2, arrF.shape[1]//2]).reshape(2,1,1)
+    vecC = np.array([M//2, N//2], dtype=matX.dtype).reshape(2,1,1)
     diff = matX - vecC 
     
     r = np.linalg.norm(diff, axis=0)
-    #y = (1 - r/(arrF.shape[0]//2)) * (arrF.shape[0]-1)
-    y = (r/(arrF.shape[0]//2)) * (arrF.shape[0]-1) 
+    #y = (1 - r/(M//2)) * (M-1)
+    y = (r/(M//2)) * (M-1) 
     
+    # the smallest and largest angle of the whole image are found in the two rows around the center
+    rows = index_grid(shape)[:, max(M//2-1, 0):M//2+1] - vecC
+    angle_range = np.arctan2(rows[0], rows[1])
+    angle_min, angle_max = angle_range.min(), angle_range.max()
+
     angle = np.arctan2(diff[0], diff[1])
-    angle = angle-angle.min() # min angle is 0 with this line
-    angle = angle/angle.max() # angle is normalized to 0-1
+    angle = angle-angle_min # min angle is 0 with this line
+    angle = angle/(angle_max-angle_min) # angle is normalized to 0-1
     #angle = (angle + 0.3) % 1.0
     angle = (angle + angle_shift/360.0) % 1.0
-    x = angle * (arrF.shape[1]-1)
+    x = angle * (N-1)
 
-    matX = np.stack([y, x])
-    
-    #arrG = img.map_coordinates(arrF, matX) # matX MUST be float
-    arrG = img.map_coordinates(np.flipud(arrF), matX) # matX MUST be float
-    arrG = arrG.reshape(M,N)
-    return np.clip(arrG, 0, 1)
+    # the source image is sampled upside down, (M-1)-y samples np.flipud(arrF) at y
+    return np.stack([(M-1) - y, x])
+
+def cylinder(arrF, angle_shift, order=3):
+    return warp(arrF, cylinder_coordinates(arrF.shape[:2], angle_shift), order=order)
 
 ######################### RADIAL BLUR EFFECT ########################################
 
@@ -118,7 +331,7 @@ def to_r_phi_plane_(f, m, n, rmax, phimax):
     xs, ys = rs * np.cos(phis), rs * np.sin(phis)
     xs, ys = xs.reshape(-1), ys.reshape(-1)
     
-    coords = np.vstack((ys, xs))
+    coords = np.vstack((ys, xs)).astype(coordinate_dtype())
     #print(coords.shape)
     
     vecC = np.array([f.shape[0]//2, f.shape[1]//2]).reshape(2,1)
@@ -142,57 +355,72 @@ def from_r_phi_plane_V2_(g, m, n, rmax, phimax):
      
     iis = phis / phimax * (m-1)
     jjs = rs / rmax * (n-1)
-    coords = np.vstack((iis, jjs)) 
+    coords = np.vstack((iis, jjs)).astype(coordinate_dtype())
     #print(iis, jjs)
     
     h = img.map_coordinates(g, coords, order=3)
     h = h.reshape(m, n)
     return np.fliplr(np.flipud(h))
 
-def radial_blur_effect(arrF, sigma):
-    arrF = np.flipud(arrF)
-    m, n = arrF.shape
-    rmax = np.sqrt((m/2)**2 + (n/2)**2)
-    phimax = 2 * np.pi
+POLAR_CACHE_SIZE = 6
+_polar_cache = LRUCache(max_entries=POLAR_CACHE_SIZE)
 
-    arrG = to_r_phi_plane_(arrF, m, n, rmax, phimax)
+def polar_coordinates(shape, inverse=False):
+    # read-only sampling coordinates of the polar image (angle x radius) of an image of the given shape, or with
+    # inverse=True of the image from its polar image. same maps as to_r_phi_plane_ and from_r_phi_plane_V2_ with
+    # the flips of the radial blur folded in.
+    shape = (int(shape[0]), int(shape[1]))
+    dtype = coordinate_dtype()
+    key = ("polar", shape, dtype, inverse)
+    coords = _grid_cache.get(key)
+    if coords is None:
+        m, n = shape
+        rmax = np.sqrt((m/2)**2 + (n/2)**2)
+        phimax = 2 * np.pi
+        if not inverse:
+            rs, phis = np.meshgrid(np.linspace(0, rmax, n), np.linspace(0, phimax, m), sparse=True)
+            coords = np.stack(np.broadcast_arrays((m-1) - (rs*np.sin(phis) + m//2), rs*np.cos(phis) + n//2))[:, ::-1]
+        else:
+            xs, ys = np.meshgrid(np.arange(n) - n//2, np.arange(m) - m//2, sparse=True)
+            rs, phis = np.sqrt(xs**2 + ys**2), np.arctan2(ys, xs) + np.pi
+            coords = np.stack(np.broadcast_arrays(phis / phimax * (m-1), rs / rmax * (n-1)))[:, ::-1, ::-1]
+        coords = np.ascontiguousarray(coords, dtype=dtype)
+        coords.flags.writeable = False
+        _grid_cache.put(key, coords, coords.nbytes)
+    return coords
 
-    blurred_arrG = img.gaussian_filter1d(arrG, sigma=sigma, axis=0, mode="wrap")
+def to_polar(arrF):
+    # polar image of a 2d image, kept for the latest images since it does not depend on the blur
+    key = image_key(arrF) + (coordinate_dtype(),)
+    entry = _polar_cache.get(key)
+    if entry is None:
+        entry = (arrF, img.map_coordinates(as_float(arrF), polar_coordinates(arrF.shape), order=3))
+        _polar_cache.put(key, entry, entry[1].nbytes)
+    return entry[1]
 
-    arrH = from_r_phi_plane_V2_(blurred_arrG, m, n, rmax, phimax)
+def from_polar(arrG):
+    # image of a polar image of the same shape
+    return img.map_coordinates(arrG, polar_coordinates(arrG.shape, inverse=True), order=3)
 
-    return np.clip(arrH, 0, 1)
+def radial_blur_effect(arrF, sigma):
+    # only the blur of the (cached) polar image depends on sigma
+    arrG = img.gaussian_filter1d(to_polar(arrF), sigma=sigma, axis=0, mode="wrap")
+    return clip(from_polar(arrG), arrF.dtype)
 
 ####################################################################################
 
-def perspective_mapping(arrF, arrH, u_ul, u_ur, u_ll, u_lr, debug=False):
-    if len(arrF.shape)==2 and len(arrH.shape)==2:
-        return perspective_mapping_(arrF, arrH, u_ul, u_ur, u_ll, u_lr, debug)
-    else:
-        arrF_ = Image.fromarray((arrF*255).astype(np.uint8)).convert(mode="RGB")
-        arrF_ = np.array(arrF_) / 255.0
-        arrH_ = Image.fromarray((arrH*255).astype(np.uint8)).convert(mode="RGB")
-        arrH_ = np.array(arrH_) / 255.0
-
-        output = []
-        for i in range(3):
-            output.append( perspective_mapping_(arrF_[:,:,i], arrH_[:,:,i], u_ul, u_ur, u_ll, u_lr, debug) )
-        return np.stack(output, axis=2)
-
-def perspective_mapping_(arrF, arrH, u_ul, u_ur, u_ll, u_lr, debug=False):
-    M, N = arrH.shape
-    u, v = np.meshgrid(np.arange(N), np.arange(M))
-    matX = np.stack((u, v)).astype(float)
-    
+def homography(shape, u_ul, u_ur, u_ll, u_lr):
+    # coefficients (a,b,c,d,e,f,g,h) of the projective map from the four corners (u, v) in the destination image
+    # to the corners of a source image of the given shape
     u1, v1 = u_ul
     u2, v2 = u_ur
     u3, v3 = u_ll
     u4, v4 = u_lr
     
     x1, y1 = 0, 0
-    x2, y2 = arrF.shape[1], 0
-    x3, y3 = 0, arrF.shape[0]
-    x4, y4 = arrF.shape[1], arrF.shape[0]
+    x2, y2 = shape[1], 0
+    x3, y3 = 0, shape[0]
+    x4, y4 = shape[1], shape[0]
     
     A = [[u1, v1, 1, 0, 0, 0, -u1*x1, -v1*x1],
          [u2, v2, 1, 0, 0, 0, -u2*x2, -v2*x2],
@@ -206,31 +434,73 @@ def perspective_mapping_(arrF, arrH, u_ul, u_ur, u_ll, u_lr, debug=False):
     A = np.array(A)
     b = np.array([x1, x2, x3, x4, y1, y2, y3, y4]).T
     X, _, _, _ = np.linalg.lstsq(A, b, rcond=None)
-    a,b,c,d,e,f,g,h = X
-    
-    X_ = (a*matX[0] + b*matX[1] + c) / (g*matX[0] + h*matX[1] + 1)
-    Y_ = (d*matX[0] + e*matX[1] + f) / (g*matX[0] + h*matX[1] + 1)
-    
-    matX = np.stack((Y_, X_))
-    
-    arrG = img.map_coordinates(arrF, matX, cval=-1) # matX MUST be float
-    arrG = arrG.reshape(matX.shape[1],matX.shape[2])
+    return X
+
+def perspective_coordinates(shape, source_shape, u_ul, u_ur, u_ll, u_lr, window=None):
+    # source coordinates (y, x) of every pixel of the destination image, the homography is solved once for all channels
+    matX = window_grid(shape, window)[::-1] # (u, v)
+    a,b,c,d,e,f,g,h = homography(source_shape, u_ul, u_ur, u_ll, u_lr).astype(matX.dtype)
     
-    mask = arrG != -1
-    #mask = np.bitwise_and(arrG != -1, arrG<230)
+    W = g*matX[0] + h*matX[1] + 1
+    X_ = (a*matX[0] + b*matX[1] + c) / W
+    Y_ = (d*matX[0] + e*matX[1] + f) / W
+    return np.stack((Y_, X_))
+
+def split_alpha(arrF):
+    # color channels (2d or rgb) and alpha channel (or None) of a gray, gray+alpha, rgb or rgba image
+    if arrF.ndim == 2:
+        return arrF, None
+    if arrF.shape[2] in (2, 4):
+        return (arrF[:,:,0] if arrF.shape[2]==2 else arrF[:,:,:3]), arrF[:,:,-1]
+    return (arrF[:,:,0] if arrF.shape[2]==1 else arrF), None
+
+def perspective_shape(arrF, arrH):
+    # the result is gray if both images are gray and rgb otherwise, alpha channels are not kept
+    if split_alpha(arrF)[0].ndim == 2 and split_alpha(arrH)[0].ndim == 2:
+        return arrH.shape[:2]
+    return arrH.shape[:2] + (3,)
+
+def perspective_mapping(arrF, arrH, u_ul, u_ur, u_ll, u_lr, debug=False, order=3):
+    # maps arrF onto the quadrilateral u_ul, u_ur, u_ll, u_lr of arrH. all channels are sampled from one coordinate
+    # map, the alpha channel of arrF blends it over arrH. order=1 samples bilinearly, e.g. while corners are dragged.
+    dtype = arrH.dtype
+    colorF, alpha = split_alpha(arrF)
+    colorH, _ = split_alpha(arrH)
+    matX = perspective_coordinates(arrH.shape[:2], arrF.shape[:2], u_ul, u_ur, u_ll, u_lr)
+
+    # pixels mapped from outside of arrF, map_coordinates would return cval there
+    mask = (matX[0] >= 0) & (matX[0] <= arrF.shape[0]-1) & (matX[1] >= 0) & (matX[1] <= arrF.shape[1]-1)
+    def sample_channels(channels):
+        # cubic splines sample the cached coefficients of arrF
+        source = spline_coefficients(channels, order) if order > 1 else as_float(channels)
+        def sample_channel(channel):
+            return img.map_coordinates(channel, matX, order=order, mode="constant", prefilter=False) # matX MUST be float
+        return sample_channel(source) if source.ndim == 2 else np.stack([sample_channel(source[:,:,i]) for i in range(3)], axis=2)
+
+    arrG = sample_channels(colorF)
+    weight = None if alpha is None else np.where(mask, np.clip(sample_channels(alpha), 0, 1), 0)
     
     if debug:
+        import matplotlib.pyplot as plt
         plt.imshow(arrG, cmap="gray"); plt.title("Transformed Image"); plt.show()
-        plt.imshow(mask, cmap="gray"); plt.title("Mask")
+        plt.imshow(mask if weight is None else weight, cmap="gray"); plt.title("Mask")
 
-    newArr = arrH.copy()
-    newArr[mask] = arrG[mask]
-    return np.clip(newArr, 0, 1)
+    newArr = as_float(colorH)
+    if len(perspective_shape(arrF, arrH)) == 3:
+        # gray images are used as rgb like PIL converts them
+        newArr = np.repeat(newArr[:,:,None], 3, axis=2) if newArr.ndim == 2 else newArr
+        arrG = arrG[:,:,None] if arrG.ndim == 2 else arrG
+        mask = mask[:,:,None]
+        weight = None if weight is None else weight[:,:,None]
+    if weight is None:
+        newArr = np.where(mask, arrG, newArr)
+    else:
+        newArr = newArr + (arrG - newArr) * weight
+    return clip(newArr, dtype)
 
 def perspective_mapping_transparent(arrF, arrH, u_ul, u_ur, u_ll, u_lr, debug=False):
     M, N = arrH.shape
-    u, v = np.meshgrid(np.arange(N), np.arange(M))
-    matX = np.stack((u, v)).astype(float)
+    matX = index_grid((M, N))[::-1] # (u, v)
     
     u1, v1 = u_ul
     u2, v2 = u_ur
@@ -268,6 +538,7 @@ def perspective_mapping_transparent(arrF, arrH, u_ul, u_ur, u_ll, u_lr, debug=Fa
     mask = np.bitwise_and(arrG != -1, arrG<230)
     
     if debug:
+        import matplotlib.pyplot as plt
         plt.imshow(arrG, cmap="gray"); plt.title("Transformed Image"); plt.show()
         plt.imshow(mask, cmap="gray"); plt.title("Mask")
 
@@ -280,57 +551,265 @@ def perspective_mapping_transparent(arrF, arrH, u_ul, u_ur, u_ll, u_lr, debug=Fa
 def lpNorm(matX, p):
     return np.power(np.sum(np.power(np.abs(matX), p), axis=0), 1/p)
 
-def square_eye_effect(arrF, vecC, sigma, p):
-    vecC = np.array(vecC).reshape(-1,1)
-    M, N = arrF.shape
-    u, v = np.meshgrid(np.arange(N), np.arange(M))
-    
-    matX = np.vstack((v.flatten(), u.flatten())).astype(float) 
+def square_eye_coordinates(shape, vecC, sigma, p, window=None, points=None):
+    matX = window_grid(shape, window, points)
+    vecC = np.array(vecC, dtype=matX.dtype).reshape(2,1,1)
     matR = vecC - matX     # vectors pointing to center
-    matX = matX + matR * np.exp(-lpNorm(matR, p)**2 / (2*sigma**2))
-    
-    arrG = img.map_coordinates(arrF, matX)
-    arrG = arrG.reshape(M,N)
-    return np.clip(arrG, 0, 1)
+    return matX + matR * np.exp(-lpNorm(matR, p)**2 / (2*sigma**2))
+
+def square_eye_effect(arrF, vecC, sigma, p, order=3):
+    return warp(arrF, square_eye_coordinates(arrF.shape[:2], vecC, sigma, p), order=order)
+
+# coordinate map builders of the warps, lets callers build the map once and sample every channel from it
+# the parameters of a prepared warp are (arrF, arguments of the builder..., order)
+WARPS = {fisheye_effect: fisheye_coordinates,
+         swirl_effect: swirl_coordinates,
+         waves_effect: waves_coordinates,
+         cylinder: cylinder_coordinates,
+         square_eye_effect: square_eye_coordinates}
+
+def warp_arguments(params):
+    # arguments of the coordinate builder and interpolation order of a prepared warp
+    return tuple(params[1:-1]), params[-1]
+
+# pixels of a localized warp that move less than this (in pixels) keep their value instead of being resampled
+INFLUENCE_TOLERANCE = 1e-3
+
+def influence_radius(displacement, rmax):
+    # distance from the center beyond which displacement(distance) stays below the tolerance, sampled every half pixel
+    r = np.arange(0, rmax + 1, 0.5)
+    moved = np.nonzero(displacement(r) >= INFLUENCE_TOLERANCE)[0]
+    return 0. if len(moved) == 0 else r[moved[-1]] + 0.5
+
+def influence_region(f, params):
+    # window (r0, r1, c0, c1) outside of which a prepared fish eye or square eye moves no pixel by more than the
+    # tolerance, None for warps that move pixels everywhere. fish eye moves pixels by r*delta(r), square eye by
+    # |r| * exp(-|r|_p**2 / (2 sigma**2)) where |r| <= sqrt(2)*|r|_p and both components of r are at most |r|_p.
+    if f is fisheye_effect:
+        arrF, vecC, sigma, dfct = params[:4]
+        displacement = lambda r: r * dfct(r, sigma)
+    elif f is square_eye_effect:
+        arrF, vecC, sigma, p = params[:4]
+        displacement = lambda r: np.sqrt(2) * r * np.exp(-r**2 / (2*sigma**2))
+    else:
+        return None
+    M, N = arrF.shape[:2]
+    corners = np.array([[0, 0, M-1, M-1], [0, N-1, 0, N-1]], dtype=float) - np.reshape(vecC, (2,1))
+    # a box wider than the largest distance of a corner along an axis covers the image already
+    radius = influence_radius(displacement, float(np.abs(corners).max()))
+    r0, r1 = [int(np.clip(v, 0, M)) for v in (np.floor(vecC[0] - radius), np.ceil(vecC[0] + radius) + 1)]
+    c0, c1 = [int(np.clip(v, 0, N)) for v in (np.floor(vecC[1] - radius), np.ceil(vecC[1] + radius) + 1)]
+    return (r0, max(r0, r1), c0, max(c0, c1))
+
+# a region covering at least this fraction of the image is sampled from the cached spline coefficients of the whole
+# image, a smaller one prefilters only the part of the image it samples
+INFLUENCE_CACHE_FRACTION = 0.25
+
+def cache_region(arrF, region):
+    # whether a localized warp uses (and fills) the spline coefficient cache
+    r0, r1, c0, c1 = region
+    return (r1-r0) * (c1-c0) >= INFLUENCE_CACHE_FRACTION * arrF.shape[0] * arrF.shape[1]
+
+def intersect(window, region):
+    # part of a window (r0, r1, c0, c1) inside a region, None if they do not overlap
+    r0, r1 = max(window[0], region[0]), min(window[1], region[1])
+    c0, c1 = max(window[2], region[2]), min(window[3], region[3])
+    return (r0, r1, c0, c1) if r0 < r1 and c0 < c1 else None
 
 ####################################################################################
 
-def median_filter(arrF, size):
+# window size from which the median is computed from window histograms instead of sorting every window
+MEDIAN_HISTOGRAM_SIZE = 15
+
+def median_histogram(arrF, size):
+    # median of 8 bit images by threshold decomposition: the median is at least t where more than half of the
+    # window is at least t. one running box sum per gray level, so the cost does not depend on the window size.
+    # the border is reflected like scipy's median_filter does, the result is identical to it.
+    low, high = int(arrF.min()), int(arrF.max())
+    output = np.full(arrF.shape, low, dtype=np.uint8)
+    above, rows, window = np.empty(arrF.shape, np.uint8), np.empty(arrF.shape, np.float32), np.empty(arrF.shape, np.float32)
+    half = np.float32((size*size//2 + 0.5) / (size*size)) # halfway between two counts, far above the float32 error
+    for t in range(low+1, high+1):
+        np.greater_equal(arrF, t, out=above)
+        for axis in range(2):
+            img.uniform_filter1d(above if axis==0 else rows, size, axis=axis, output=rows if axis==0 else window, mode="reflect")
+        output += window > half
+    return output
+
+def median_filter(arrF, size, engine=None):
+    # engine is "sort" (scipy), "histogram" or None to pick the histogram engine for large windows
     if size<=0:
         return arrF
     size = int((size//2)*2)+1
+    if engine is None:
+        engine = "histogram" if size >= MEDIAN_HISTOGRAM_SIZE else "sort"
     #arrF_ = Image.fromarray((arrF*255).astype(np.uint8)).convert(mode="L")
     #output = arrF_.filter(ImageFilter.MedianFilter(size = size))
     #output = np.array(output) / 255.0
-    output = scipy_median_filter(arrF, size)
-    return np.clip(output, 0, 1)
+    if engine == "histogram":
+        # float images are quantized to 8 bit
+        output = median_histogram(to_uint8(arrF), size)
+        return output if arrF.dtype == np.uint8 else to_working_precision(output, arrF.dtype)
+    output = img.median_filter(arrF, size) # runs natively on uint8 images
+    return clip(output, arrF.dtype) if arrF.dtype.kind == "f" else output
+
+
+# radius from which the gaussian is approximated by box blurs, whose cost does not depend on the radius
+GAUSSIAN_BOX_RADIUS = 6
 
+def box_blur_sizes(sigma, n=3):
+    # odd sizes of n box blurs that add up to the variance of a gaussian with standard deviation sigma
+    ideal = np.sqrt(12*sigma*sigma/n + 1)
+    lower = int(np.floor(ideal))
+    lower -= 1 - lower%2
+    m = int(round((12*sigma*sigma - n*lower*lower - 4*n*lower - 3*n) / (-4*lower - 4)))
+    return [lower]*m + [lower+2]*(n-m)
 
 def gaussian_filter(arrF, radius):
+    # radius is the standard deviation like for PIL's GaussianBlur, all channels are blurred in one call
     if radius<=0:
         return arrF
-    arrF_ = Image.fromarray((arrF*255).astype(np.uint8)).convert(mode="L")
-    output = arrF_.filter(ImageFilter.GaussianBlur(radius = radius))
-    output = np.array(output) / 255.0
-    return np.clip(output, 0, 1)
+    output = as_float(arrF)
+    if radius < GAUSSIAN_BOX_RADIUS:
+        output = img.gaussian_filter(output, [radius, radius] + [0]*(arrF.ndim-2), mode="nearest")
+    else:
+        for size in box_blur_sizes(radius):
+            for axis in range(2):
+                output = img.uniform_filter1d(output, size, axis=axis, mode="nearest")
+    return clip(output, arrF.dtype)
 
-def mean_filter(arrF, size):
-    if size<=0:
-        return arrF
-    # recursive mean filtering algorithm
-    def rowMeanFilterRec(arrF, m):
-        f = np.pad(arrF, ((0,0), (m,m))) # padding on left and right for m pixels
-        f1 = np.roll(f, m//2+1, axis=1)
-        f2 = np.roll(f, -m//2+1, axis=1)
-        g = np.cumsum((-f1 + f2), axis=1)
-        return g[:, m:-m] / m # doing the division here is important for numerical accuracy
+SAT_CACHE_SIZE = 2
+SAT_CACHE_BYTES = 768*2**20 # float64 tables, 549 MB for a 24 MP RGB image
+_sat_cache = LRUCache(max_entries=SAT_CACHE_SIZE, max_bytes=SAT_CACHE_BYTES)
+
+def summed_area_table(arrF):
+    # (M+1,N+1,...) cumulative sums of the image with a leading row and column of zeros, kept for the latest images
+    # so that every box size of the mean filter is answered from the same table
+    key = image_key(arrF)
+    entry = _sat_cache.get(key)
+    if entry is None:
+        table = np.zeros((arrF.shape[0]+1, arrF.shape[1]+1) + arrF.shape[2:], dtype=np.float64)
+        np.cumsum(np.cumsum(as_float(arrF), axis=0, dtype=np.float64), axis=1, out=table[1:, 1:])
+        entry = (arrF, table)
+        _sat_cache.put(key, entry, table.nbytes)
+    return entry[1]
 
-    arrG = rowMeanFilterRec(arrF, int(size)).T
-    arrG = rowMeanFilterRec(arrG, int(size)).T
-    return np.clip(arrG, 0, 1)
+def mean_filter(arrF, size, window=None):
+    # mean of the size x size window [i-size//2, i+size-size//2-1] of every pixel, pixels outside of the image count
+    # as zero. four lookups into the summed area table per pixel, whatever the size.
+    # window (r0, r1, c0, c1) restricts the output to a tile of the image.
+    m = int(size)
+    M, N = arrF.shape[:2]
+    rows, cols = (np.arange(M), np.arange(N)) if window is None else (np.arange(*window[:2]), np.arange(*window[2:]))
+    if m<=0:
+        return arrF if window is None else arrF[rows[0]:rows[-1]+1, cols[0]:cols[-1]+1]
+    table = summed_area_table(arrF)
+    r0 = np.clip(rows - m//2, 0, M)
+    r1 = np.clip(rows + m - m//2, 0, M)
+    c0 = np.clip(cols - m//2, 0, N)
+    c1 = np.clip(cols + m - m//2, 0, N)
+    rows = table[r1] - table[r0] # window sums along the rows, then along the columns
+    arrG = np.take(rows, c1, axis=1)
+    arrG -= np.take(rows, c0, axis=1)
+    arrG /= m*m
+    return clip(arrG, arrF.dtype)
 
-def bilateral_filter(arrF, sigma, rho):
-    return cv2.bilateralFilter(arrF.astype(np.float32), -1, sigma, rho)
+# upper bound of the cells of a bilateral grid, larger images are filtered in bands
+BILATERAL_GRID_CELLS = 2**23
+
+def luminance(arrF):
+    return arrF[:,:,0]*0.299 + arrF[:,:,1]*0.587 + arrF[:,:,2]*0.114
+
+def bilateral_cells(shape, sigma, rho):
+    # cell sizes in space and range and the number of cells of the grid of an image of the given shape
+    ss = max(float(sigma), 1.)           # cell sizes, smaller cells than a pixel do not add anything
+    sr = max(float(rho), 1./255)
+    spatial = (int(np.ceil((shape[0]-1)/ss)) + 1, int(np.ceil((shape[1]-1)/ss)) + 1)
+    return ss, sr, spatial, int(np.ceil(1./sr)) + 1
+
+def bilateral_joint(shape, sigma, rho, color=True):
+    # whether an rgb(a) image of the given shape is filtered on the joint 5d grid, decided from the shape of the whole
+    # image so that its tiles and bands are filtered the same way
+    if not color or len(shape) < 3 or shape[2] not in (3, 4):
+        return False
+    _, _, spatial, range_cells = bilateral_cells(shape, sigma, rho)
+    return spatial[0]*spatial[1]*range_cells**3 <= BILATERAL_GRID_CELLS
+
+def bilateral_grid(arrF, sigma, rho, joint=False, offset=(0, 0)):
+    # bilateral filter on a (rows x columns x range) grid downsampled by sigma in space and rho in range:
+    # pixels are accumulated into the grid, the grid is blurred with a gaussian and the result is interpolated back.
+    # the cost does not depend on sigma and the error is bounded by the cell size, about half a sigma in space and range.
+    # rgb images are filtered jointly on a 5d grid over the three channels if joint is set, otherwise all channels
+    # share the weights of their luminance on a 3d grid. an alpha channel is not a range axis of the grid, it is
+    # filtered with the weights of the color channels.
+    # offset (row, column) aligns the cells of a band or tile of a larger image with the cells of the whole image.
+    M, N = arrF.shape[:2]
+    values = as_float(arrF).reshape(M, N, -1)
+    cdtype = coordinate_dtype()
+    ss, sr, _, range_cells = bilateral_cells(arrF.shape, sigma, rho)
+    first = (np.floor(offset[0]/ss), np.floor(offset[1]/ss))
+    spatial = (int(np.ceil((offset[0]+M-1)/ss) - first[0]) + 1, int(np.ceil((offset[1]+N-1)/ss) - first[1]) + 1)
+
+    color = values[:,:,:3] if values.shape[2] >= 3 else values[:,:,:1]
+    if color.shape[2]==3 and joint:
+        guide = color
+    elif color.shape[2]==3:
+        guide = luminance(color)[:,:,None]
+    else:
+        guide = color
+    grid_shape = spatial + (range_cells,)*guide.shape[2]
+
+    matX = index_grid((M, N), cdtype)
+    coordinates = [(matX[0] + offset[0])/ss - first[0], (matX[1] + offset[1])/ss - first[1]]
+    coordinates += [np.clip(guide[:,:,k], 0, 1).astype(cdtype)/sr for k in range(guide.shape[2])]
+    # pixels are splatted into the nearest cell of the whole image, rounding after the shift by the first cell would
+    # round halves differently in tiles at an odd number of cells
+    indices = [np.rint((matX[0] + offset[0])/ss) - first[0], np.rint((matX[1] + offset[1])/ss) - first[1]]
+    indices += [np.rint(x) for x in coordinates[2:]]
+    cells = np.ravel_multi_index([x.astype(np.intp) for x in indices], grid_shape).ravel()
+
+    def splat_blur_slice(weights):
+        grid = np.bincount(cells, weights, minlength=int(np.prod(grid_shape))).astype(values.dtype).reshape(grid_shape)
+        grid = img.gaussian_filter(grid, [sigma/ss]*2 + [rho/sr]*guide.shape[2], mode="constant", truncate=3.)
+        return img.map_coordinates(grid, coordinates, order=1, prefilter=False)
+
+    normalization = splat_blur_slice(None)
+    normalization = np.maximum(normalization, np.finfo(values.dtype).tiny)
+    arrG = np.stack([splat_blur_slice(values[:,:,k].ravel()) / normalization for k in range(values.shape[2])], axis=2)
+    return clip(arrG.reshape(arrF.shape), arrF.dtype)
+
+def bilateral_filter(arrF, sigma, rho, engine="grid", color=True, offset=(0, 0), joint=None):
+    # rho is relative to the value range [0,1] of float images, also for uint8 images
+    # a tile of a larger image is given its offset (row, column) in the image and whether the whole image is filtered
+    # on the joint color grid (see bilateral_joint)
+    if sigma<=0 or rho<=0:
+        return arrF
+    if engine == "opencv":
+        import cv2
+        if len(arrF.shape)==3:
+            return np.stack([bilateral_filter(arrF[:,:,i], sigma, rho, engine) for i in range(arrF.shape[2])], axis=2)
+        if arrF.dtype == np.uint8:
+            # runs natively on uint8, the range sigma is scaled to keep the behaviour of float images
+            return cv2.bilateralFilter(arrF, -1, sigma, rho*255)
+        return cv2.bilateralFilter(arrF.astype(np.float32), -1, sigma, rho).astype(arrF.dtype, copy=False)
+
+    # filter bands of rows with a halo if the grid of the whole image gets too large
+    if joint is None:
+        joint = bilateral_joint(arrF.shape, sigma, rho, color)
+    M, N = arrF.shape[:2]
+    ss, sr = max(float(sigma), 1.), max(float(rho), 1./255)
+    cells_per_row = (N/ss + 1) * (1./sr + 2)**(3 if joint else 1) / ss # one range axis per channel of the guide
+    band = int(BILATERAL_GRID_CELLS / cells_per_row)
+    if band >= M or joint:
+        return bilateral_grid(arrF, sigma, rho, joint, offset)
+    halo = int(np.ceil(4*sigma + 2*ss))
+    band = max(band - 2*halo, halo)
+    arrG = np.empty_like(arrF)
+    for r0 in range(0, M, band):
+        r1 = min(r0+band, M)
+        R0, R1 = max(r0-halo, 0), min(r1+halo, M)
+        arrG[r0:r1] = bilateral_grid(arrF[R0:R1], sigma, rho, joint, (offset[0]+R0, offset[1]))[r0-R0:r1-R0]
+    return arrG
 
 def bilateral_filter_(arrF, sigma, rho):
     m = int(np.ceil((2.575 * sigma) * 2 + 1))
@@ -369,6 +848,237 @@ def bilateral_filter_(arrF, sigma, rho):
             
     return arrG
 
+######################### EFFECT RECIPES ###########################################
+
+# parameters of every effect by name, shared by the GUI, the undo history and batch recipes
+DEFAULT_PARAMETERS = {"fisheye": {"x": 0, "y": 0, "sigma": 1.0}, 
+                      "swirl": {"x": 0, "y": 0, "sigma": 0.01, "magnitude":0},
+                      "waves": {"amplitude": 0.1, "frequency": 0.1, "phase": 0},
+                      "cylinder": {"angle": 0.0},
+                      "radial_blur": {"sigma": 0.1},
+                      "pers_mapping": {"x1":0, "y1":0, "x2":0, "y2":0, "x3":0, "y3":0, "x4":0, "y4":0},
+                      "square_eye": {"x": 0, "y": 0, "sigma": 1.0, "p_value":0.1},
+                      "median": {"size": 3.0},
+                      "gaussian": {"radius": 2.0},
+                      "bilateral": {"sigma": 100, "rho": 50},
+                      "mean": {"size": 3.0},}
+
+def prepare_effect(effect_name, arrF, parameters, scale=1.0, arrH=None):
+    # translates the named parameters of an effect into (function, arguments, split_dimensions)
+    # scale converts pixel sized parameters for a downscaled copy of the image, arrH is the image perspective mapping warps onto arrF
+    # warps and perspective mapping interpolate with the spline order of the "order" parameter, cubic by default
+    p, s = parameters, scale
+    order = p.get("order", 3)
+    if effect_name=="fisheye":
+        return fisheye_effect, (arrF, (p["y"]*s, p["x"]*s), p["sigma"]*s, delta1, order), True
+    elif effect_name=="swirl":
+        return swirl_effect, (arrF, (p["y"]*s, p["x"]*s), p["sigma"], p["magnitude"], order), True
+    elif effect_name=="waves":
+        amplitude = [p["amplitude"]*s, p["amplitude"]*s]
+        frequency = [p["frequency"]*s, p["frequency"]*s]
+        phase = [p["phase"], p["phase"]]
+        return waves_effect, (arrF, amplitude, frequency, phase, order), True
+    elif effect_name=="cylinder":
+        return cylinder, (arrF, p["angle"], order), True
+    elif effect_name=="radial_blur":
+        return radial_blur_effect, (arrF, p["sigma"]*s), True
+    elif effect_name=="pers_mapping":
+        u_ul = (p["x1"]*s, p["y1"]*s)
+        u_ur = (p["x2"]*s, p["y2"]*s)
+        u_ll = (p["x3"]*s, p["y3"]*s)
+        u_lr = (p["x4"]*s, p["y4"]*s)
+        return perspective_mapping, (arrH, arrF, u_ul, u_ur, u_ll, u_lr, False, order), False
+    elif effect_name=="square_eye":
+        return square_eye_effect, (arrF, (p["y"]*s, p["x"]*s), p["sigma"]*s, p["p_value"], order), True
+    elif effect_name=="median":
+        return median_filter, (arrF, p["size"]*s), True
+    elif effect_name=="gaussian":
+        return gaussian_filter, (arrF, p["radius"]*s), False
+    elif effect_name=="bilateral":
+        return bilateral_filter, (arrF, p["sigma"]*s, p["rho"], "grid", True), False
+    elif effect_name=="mean":
+        return mean_filter, (arrF, p["size"]*s), False
+    raise ValueError("Unknown effect: %s" % effect_name)
+
+def run_effect(f, params, split_dimensions=True, mapper=map):
+    # runs a prepared effect channel by channel if split_dimensions is set, in the calling thread unless mapper
+    # (function, channels) runs the channels elsewhere
+    # the stages are timed for the statistics of the GUI, the filter stage includes its clipping
+    if f in WARPS:
+        arguments, order = warp_arguments(params)
+        region = influence_region(f, params)
+        if region is not None:
+            # a localized warp only resamples the region it moves, the other pixels are copied
+            with stage("copy"):
+                output = params[0].copy()
+            M, N = params[0].shape[:2]
+            window = intersect(region, (0, M, 0, N)) # None if the warp moves no pixel
+            if window is not None:
+                r0, r1, c0, c1 = window
+                with stage("grid"):
+                    matX = WARPS[f](params[0].shape[:2], *arguments, window=window)
+                output[r0:r1, c0:c1] = sample_window(params[0], matX, mapper, order, cache_region(params[0], region))
+            return output
+        with stage("grid"):
+            matX = WARPS[f](params[0].shape[:2], *arguments)
+        return warp(params[0], matX, mapper, order)
+    with stage("filter"):
+        if len(params[0].shape)==2 or not split_dimensions:
+            return f(*params)
+        channels = list(mapper(partial(apply_to_channel, f, params[0], params[1:]), range(params[0].shape[2])))
+    with stage("stack"):
+        return np.stack(channels, axis=2)
+
+def apply_effect(arrF, effect_name, parameters, arrH=None):
+    return run_effect(*prepare_effect(effect_name, arrF, parameters, arrH=arrH))
+
+def fused_coordinates(shape, steps, window=None):
+    # source coordinates of a chain of warps [(coordinate builder, arguments, ...), ...] applied to an image of the given
+    # shape, composed from the last warp to the first so that the chain is sampled once. points that leave one of the
+    # intermediate images are moved outside of the source, where sampling them gives 0 as a warp of its own would.
+    shapes = [tuple(shape[:2])]
+    for builder, args in [step[:2] for step in steps]:
+        shapes.append(waves_shape(shapes[-1], args[0]) if builder is waves_coordinates else shapes[-1])
+    matX = window_grid(shapes[-1], window)
+    inside = np.ones(matX.shape[1:], dtype=bool)
+    for (builder, args), (M, N) in zip([step[:2] for step in reversed(steps)], reversed(shapes[:-1])):
+        matX = builder((M, N), *args, points=matX)
+        inside &= (matX[0] >= 0) & (matX[0] <= M-1) & (matX[1] >= 0) & (matX[1] <= N-1)
+    return np.where(inside, matX, -1).astype(matX.dtype, copy=False)
+
+def apply_recipe(arrF, recipe):
+    # applies [(effect_name, parameters, arrH), ...] in order, consecutive warps are fused into one resampling pass
+    # instead of interpolating (and blurring) the image once per warp, with the highest order of the fused warps.
+    # the images of a recipe are sampled once, their spline coefficients are not cached.
+    steps = []
+    def flush(arrF):
+        if len(steps) == 1:
+            arrF = warp(arrF, steps[0][0](arrF.shape[:2], *steps[0][1]), order=steps[0][2], cache=False)
+        elif steps:
+            arrF = warp(arrF, fused_coordinates(arrF.shape[:2], steps), order=max(step[2] for step in steps), cache=False)
+        del steps[:]
+        return arrF
+
+    for effect_name, parameters, arrH in recipe:
+        f, params, split_dimensions = prepare_effect(effect_name, arrF, parameters, arrH=arrH)
+        if f in WARPS:
+            arguments, order = warp_arguments(params)
+            steps.append((WARPS[f], arguments, order))
+        else:
+            # prepared again on the warped image, the image is not always the first parameter (perspective mapping)
+            arrF = flush(arrF)
+            arrF = run_effect(*prepare_effect(effect_name, arrF, parameters, arrH=arrH))
+    return flush(arrF)
+
+def output_shape(f, params):
+    # shape of the result of a prepared effect
+    if f is waves_effect:
+        return waves_shape(params[0].shape, params[1]) + params[0].shape[2:]
+    if f is perspective_mapping:
+        return perspective_shape(params[0], params[1])
+    return params[0].shape
+
+######################### TILED PROCESSING #########################################
+
+class Cancelled(Exception):
+    # raised by a checkpoint of process_tiled to abort a computation whose result is not needed anymore
+    pass
+
+# the cubic spline prefilter of a crop matches the one of the whole image up to ~0.27**12 this far from the crop border
+SPLINE_MARGIN = 12
+
+def tile_halo(f, params):
+    # pixels around a tile a filter reads to compute the tile exactly, None if an output pixel depends on the whole image
+    if f is median_filter:
+        return 0 if params[1]<=0 else int(params[1]//2)
+    elif f is mean_filter:
+        return 0 if params[1]<=0 else int(params[1])//2 + 1
+    elif f is gaussian_filter:
+        return 0 if params[1]<=0 else int(4*params[1] + 0.5) + 1 # truncation of the gaussian, wider than the box blurs
+    elif f is bilateral_filter:
+        return 0 if params[1]<=0 else int(np.ceil(4*params[1] + 2*max(params[1], 1.))) # blur of the grid plus its cells
+    return None
+
+def tile_parameters(f, params, tile, offset):
+    # parameters of a prepared filter for a tile of its image, offset is the (row, column) of the tile in the image.
+    # the bilateral filter decides between the joint color grid and the luminance grid for the whole image.
+    if f is bilateral_filter:
+        sigma, rho = params[1:3]
+        engine = params[3] if len(params) > 3 else "grid"
+        color = params[4] if len(params) > 4 else True
+        return (tile, sigma, rho, engine, color, offset, bilateral_joint(params[0].shape, sigma, rho, color))
+    return (tile,) + tuple(params[1:])
+
+def tiles(shape, tile_size):
+    for r0 in range(0, shape[0], tile_size):
+        for c0 in range(0, shape[1], tile_size):
+            yield r0, min(r0+tile_size, shape[0]), c0, min(c0+tile_size, shape[1])
+
+def sample_window(arrF, matX, mapper=map, order=3, cache=True):
+    # warp() that only reads the bounding box of the source coordinates (plus the spline margin) from a memory-mapped
+    # arrF. an image in memory is sampled from the cached spline coefficients of the whole image instead, unless cache
+    # is False and they have not been computed yet.
+    if not isinstance(arrF, np.memmap) and (cache or order < 2 or spline_key(arrF, order) in _spline_cache):
+        return warp(arrF, matX, mapper, order)
+    M, N = arrF.shape[:2]
+    r0 = int(np.clip(np.floor(matX[0].min()) - SPLINE_MARGIN, 0, M))
+    r1 = int(np.clip(np.ceil(matX[0].max()) + SPLINE_MARGIN + 1, 0, M))
+    c0 = int(np.clip(np.floor(matX[1].min()) - SPLINE_MARGIN, 0, N))
+    c1 = int(np.clip(np.ceil(matX[1].max()) + SPLINE_MARGIN + 1, 0, N))
+    if r0 >= r1 or c0 >= c1:
+        return np.zeros(matX.shape[1:] + arrF.shape[2:], dtype=arrF.dtype) # every coordinate is outside of the image
+    offset = np.array([r0, c0], dtype=matX.dtype).reshape((2,) + (1,)*(matX.ndim-1))
+    return warp(np.asarray(arrF[r0:r1, c0:c1]), matX - offset, mapper, order, cache=False)
+
+def process_tiled(f, params, split_dimensions=True, out=None, tile_size=1024, checkpoint=None, mapper=map):
+    # runs a prepared effect tile by tile, reading from and writing to (memory-mapped) arrays, so the peak memory depends
+    # on the tile size and not on the image size. warps read the bounding box of the source coordinates of a tile,
+    # filters the tile plus their halo. effects that need the whole image (radial blur, perspective mapping) run at once.
+    # checkpoint is called before every tile and can raise Cancelled to abort a computation that is not needed anymore,
+    # mapper(function, channels) runs the channels of a tile, e.g. in parallel.
+    arrF = params[0]
+    halo = tile_halo(f, params)
+    if f not in WARPS and halo is None:
+        if checkpoint is not None:
+            checkpoint()
+        output = run_effect(f, (np.asarray(arrF),) + tuple(params[1:]), split_dimensions, mapper)
+        if out is None:
+            return output
+        out[...] = output
+        return out
+
+    shape = output_shape(f, params)
+    if out is None:
+        out = np.empty(shape, dtype=arrF.dtype)
+    M, N = arrF.shape[:2]
+    region = influence_region(f, params)
+    for window in tiles(shape, tile_size):
+        if checkpoint is not None:
+            checkpoint()
+        r0, r1, c0, c1 = window
+        if f in WARPS:
+            # a localized warp copies the pixels of a tile outside of the region it moves
+            inner = window if region is None else intersect(window, region)
+            if inner != window:
+                with stage("copy"):
+                    out[r0:r1, c0:c1] = arrF[r0:r1, c0:c1]
+            if inner is None:
+                continue
+            arguments, order = warp_arguments(params)
+            with stage("grid"):
+                matX = WARPS[f](arrF.shape[:2], *arguments, window=inner)
+            cache = region is None or cache_region(arrF, region)
+            out[inner[0]:inner[1], inner[2]:inner[3]] = sample_window(arrF, matX, mapper, order, cache)
+        elif f is mean_filter and not isinstance(arrF, np.memmap):
+            # tiles look up the (cached) summed area table of the whole image
+            with stage("filter"):
+                out[r0:r1, c0:c1] = mean_filter(arrF, params[1], window)
+        else:
+            R0, R1, C0, C1 = max(r0-halo, 0), min(r1+halo, M), max(c0-halo, 0), min(c1+halo, N)
+            output = run_effect(f, tile_parameters(f, params, np.asarray(arrF[R0:R1, C0:C1]), (R0, C0)), split_dimensions, mapper)
+            out[r0:r1, c0:c1] = output[r0-R0:r1-R0, c0-C0:c1-C0]
+    return out
+
 ####################################################################################
 
 #out = fisheye(arrF, (350, 200), sigma=300)
@@ -0,0 +1,63 @@
+import json
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+class StageTimes():
+    # durations of the stages of the computation in progress, summed over the channels and tiles running in parallel
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stages = {}
+
+    def add(self, name, seconds):
+        with self.lock:
+            self.stages[name] = self.stages.get(name, 0.) + seconds
+
+    def take(self):
+        # returns the stages recorded since the last call and starts over
+        with self.lock:
+            stages, self.stages = self.stages, {}
+        return stages
+
+# the worker computes one frame at a time, the stages of model.py are recorded here
+current = StageTimes()
+
+@contextmanager
+def stage(name, times=None):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        (current if times is None else times).add(name, time.perf_counter() - t0)
+
+class Timings():
+    # stage times of the latest frames of every effect (last, mean, 95th percentile), optionally written to a log file
+    # with one json object per frame
+    def __init__(self, frames=100, log_file=None):
+        self.frames = frames
+        self.effects = {}
+        self.lock = threading.Lock()
+        self.log = None if log_file is None else open(log_file, "a")
+
+    def record(self, effect, stages, **info):
+        with self.lock:
+            history = self.effects.setdefault(effect, {})
+            for name, seconds in stages.items():
+                history.setdefault(name, deque(maxlen=self.frames)).append(seconds)
+            if self.log is not None:
+                self.log.write(json.dumps(dict(time=time.time(), effect=effect, stages=stages, **info)) + "\n")
+                self.log.flush()
+
+    def summary(self, effect):
+        with self.lock:
+            history = {name: list(values) for name, values in self.effects.get(effect, {}).items()}
+        return {name: {"last": values[-1], "mean": float(np.mean(values)), "p95": float(np.percentile(values, 95)),
+                       "count": len(values)} for name, values in history.items()}
+
+    def close(self):
+        if self.log is not None:
+            self.log.close()
+            self.log = None
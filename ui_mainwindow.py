@@ -0,0 +1,1590 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'mainwindow.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDoubleSpinBox, QFrame, QGraphicsView,
+    QGridLayout, QHBoxLayout, QHeaderView, QLabel,
+    QMainWindow, QPushButton, QSizePolicy, QSlider,
+    QSpacerItem, QSpinBox, QStatusBar, QTabWidget,
+    QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget)
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(983, 633)
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.horizontalLayout_3 = QHBoxLayout(self.centralwidget)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.treeWidget = QTreeWidget(self.centralwidget)
+        __qtreewidgetitem = QTreeWidgetItem(self.treeWidget)
+        __qtreewidgetitem.setFlags(Qt.ItemIsDragEnabled|Qt.ItemIsDropEnabled|Qt.ItemIsUserCheckable|Qt.ItemIsEnabled)
+        QTreeWidgetItem(__qtreewidgetitem)
+        QTreeWidgetItem(__qtreewidgetitem)
+        QTreeWidgetItem(__qtreewidgetitem)
+        QTreeWidgetItem(__qtreewidgetitem)
+        QTreeWidgetItem(__qtreewidgetitem)
+        QTreeWidgetItem(__qtreewidgetitem)
+        QTreeWidgetItem(__qtreewidgetitem)
+        __qtreewidgetitem1 = QTreeWidgetItem(self.treeWidget)
+        __qtreewidgetitem1.setFlags(Qt.ItemIsDragEnabled|Qt.ItemIsDropEnabled|Qt.ItemIsUserCheckable|Qt.ItemIsEnabled)
+        QTreeWidgetItem(__qtreewidgetitem1)
+        QTreeWidgetItem(__qtreewidgetitem1)
+        QTreeWidgetItem(__qtreewidgetitem1)
+        QTreeWidgetItem(__qtreewidgetitem1)
+        QTreeWidgetItem(self.treeWidget)
+        self.treeWidget.setObjectName(u"treeWidget")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.treeWidget.sizePolicy().hasHeightForWidth())
+        self.treeWidget.setSizePolicy(sizePolicy)
+        self.treeWidget.setAnimated(True)
+        self.treeWidget.setExpandsOnDoubleClick(True)
+
+        self.horizontalLayout_3.addWidget(self.treeWidget)
+
+        self.frame = QFrame(self.centralwidget)
+        self.frame.setObjectName(u"frame")
+        self.frame.setFrameShape(QFrame.StyledPanel)
+        self.frame.setFrameShadow(QFrame.Raised)
+        self.verticalLayout = QVBoxLayout(self.frame)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget_3 = QWidget(self.frame)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_4 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.graphicsView = QGraphicsView(self.widget_3)
+        self.graphicsView.setObjectName(u"graphicsView")
+
+        self.horizontalLayout_4.addWidget(self.graphicsView)
+
+        self.widget = QWidget(self.widget_3)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout_2 = QVBoxLayout(self.widget)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.load_button = QPushButton(self.widget)
+        self.load_button.setObjectName(u"load_button")
+
+        self.verticalLayout_2.addWidget(self.load_button)
+
+        self.save_button = QPushButton(self.widget)
+        self.save_button.setObjectName(u"save_button")
+
+        self.verticalLayout_2.addWidget(self.save_button)
+
+        self.reset_button = QPushButton(self.widget)
+        self.reset_button.setObjectName(u"reset_button")
+
+        self.verticalLayout_2.addWidget(self.reset_button)
+
+        self.undo_button = QPushButton(self.widget)
+        self.undo_button.setObjectName(u"undo_button")
+
+        self.verticalLayout_2.addWidget(self.undo_button)
+
+
+        self.horizontalLayout_4.addWidget(self.widget)
+
+
+        self.verticalLayout.addWidget(self.widget_3)
+
+        self.tabWidget = QTabWidget(self.frame)
+        self.tabWidget.setObjectName(u"tabWidget")
+        self.tabWidget.setEnabled(True)
+        self.tab_11 = QWidget()
+        self.tab_11.setObjectName(u"tab_11")
+        self.verticalLayout_4 = QVBoxLayout(self.tab_11)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_4.addItem(self.verticalSpacer)
+
+        self.widget_8 = QWidget(self.tab_11)
+        self.widget_8.setObjectName(u"widget_8")
+        self.horizontalLayout_13 = QHBoxLayout(self.widget_8)
+        self.horizontalLayout_13.setObjectName(u"horizontalLayout_13")
+        self.horizontalSpacer_9 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_13.addItem(self.horizontalSpacer_9)
+
+        self.icon_label = QLabel(self.widget_8)
+        self.icon_label.setObjectName(u"icon_label")
+        sizePolicy.setHeightForWidth(self.icon_label.sizePolicy().hasHeightForWidth())
+        self.icon_label.setSizePolicy(sizePolicy)
+        self.icon_label.setMaximumSize(QSize(50, 50))
+        self.icon_label.setAlignment(Qt.AlignCenter)
+
+        self.horizontalLayout_13.addWidget(self.icon_label)
+
+        self.label_27 = QLabel(self.widget_8)
+        self.label_27.setObjectName(u"label_27")
+        font = QFont()
+        font.setPointSize(30)
+        font.setBold(False)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setStrikeOut(False)
+        self.label_27.setFont(font)
+        self.label_27.setAlignment(Qt.AlignCenter)
+
+        self.horizontalLayout_13.addWidget(self.label_27)
+
+        self.horizontalSpacer_10 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_13.addItem(self.horizontalSpacer_10)
+
+
+        self.verticalLayout_4.addWidget(self.widget_8)
+
+        self.widget_9 = QWidget(self.tab_11)
+        self.widget_9.setObjectName(u"widget_9")
+        self.horizontalLayout_14 = QHBoxLayout(self.widget_9)
+        self.horizontalLayout_14.setObjectName(u"horizontalLayout_14")
+        self.horizontalSpacer_7 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_14.addItem(self.horizontalSpacer_7)
+
+        self.label_28 = QLabel(self.widget_9)
+        self.label_28.setObjectName(u"label_28")
+        font1 = QFont()
+        font1.setPointSize(20)
+        self.label_28.setFont(font1)
+        self.label_28.setAlignment(Qt.AlignCenter)
+
+        self.horizontalLayout_14.addWidget(self.label_28)
+
+        self.horizontalSpacer_8 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_14.addItem(self.horizontalSpacer_8)
+
+
+        self.verticalLayout_4.addWidget(self.widget_9)
+
+        self.widget_11 = QWidget(self.tab_11)
+        self.widget_11.setObjectName(u"widget_11")
+        self.horizontalLayout_15 = QHBoxLayout(self.widget_11)
+        self.horizontalLayout_15.setObjectName(u"horizontalLayout_15")
+        self.horizontalSpacer_12 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_15.addItem(self.horizontalSpacer_12)
+
+        self.widget_10 = QWidget(self.widget_11)
+        self.widget_10.setObjectName(u"widget_10")
+        self.verticalLayout_5 = QVBoxLayout(self.widget_10)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.label_29 = QLabel(self.widget_10)
+        self.label_29.setObjectName(u"label_29")
+        self.label_29.setTextFormat(Qt.PlainText)
+
+        self.verticalLayout_5.addWidget(self.label_29)
+
+        self.label_30 = QLabel(self.widget_10)
+        self.label_30.setObjectName(u"label_30")
+        self.label_30.setTextFormat(Qt.AutoText)
+        self.label_30.setOpenExternalLinks(True)
+
+        self.verticalLayout_5.addWidget(self.label_30)
+
+        self.label_31 = QLabel(self.widget_10)
+        self.label_31.setObjectName(u"label_31")
+        self.label_31.setTextFormat(Qt.AutoText)
+        self.label_31.setOpenExternalLinks(True)
+
+        self.verticalLayout_5.addWidget(self.label_31)
+
+        self.label_32 = QLabel(self.widget_10)
+        self.label_32.setObjectName(u"label_32")
+        self.label_32.setTextFormat(Qt.AutoText)
+        self.label_32.setOpenExternalLinks(True)
+
+        self.verticalLayout_5.addWidget(self.label_32)
+
+        self.label_3 = QLabel(self.widget_10)
+        self.label_3.setObjectName(u"label_3")
+        self.label_3.setOpenExternalLinks(True)
+
+        self.verticalLayout_5.addWidget(self.label_3)
+
+
+        self.horizontalLayout_15.addWidget(self.widget_10)
+
+        self.horizontalSpacer_13 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_15.addItem(self.horizontalSpacer_13)
+
+
+        self.verticalLayout_4.addWidget(self.widget_11)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_4.addItem(self.verticalSpacer_2)
+
+        self.tabWidget.addTab(self.tab_11, "")
+        self.tab = QWidget()
+        self.tab.setObjectName(u"tab")
+        self.horizontalLayout_5 = QHBoxLayout(self.tab)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.gridLayout = QGridLayout()
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.fisheye_sigma_spinbox = QDoubleSpinBox(self.tab)
+        self.fisheye_sigma_spinbox.setObjectName(u"fisheye_sigma_spinbox")
+
+        self.gridLayout.addWidget(self.fisheye_sigma_spinbox, 2, 3, 1, 1)
+
+        self.fisheye_y_slider = QSlider(self.tab)
+        self.fisheye_y_slider.setObjectName(u"fisheye_y_slider")
+        self.fisheye_y_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout.addWidget(self.fisheye_y_slider, 1, 2, 1, 1)
+
+        self.fisheye_sigma_slider = QSlider(self.tab)
+        self.fisheye_sigma_slider.setObjectName(u"fisheye_sigma_slider")
+        self.fisheye_sigma_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout.addWidget(self.fisheye_sigma_slider, 2, 2, 1, 1)
+
+        self.fisheye_y_spinbox = QSpinBox(self.tab)
+        self.fisheye_y_spinbox.setObjectName(u"fisheye_y_spinbox")
+
+        self.gridLayout.addWidget(self.fisheye_y_spinbox, 1, 3, 1, 1)
+
+        self.label_9 = QLabel(self.tab)
+        self.label_9.setObjectName(u"label_9")
+        self.label_9.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout.addWidget(self.label_9, 0, 1, 1, 1)
+
+        self.label_6 = QLabel(self.tab)
+        self.label_6.setObjectName(u"label_6")
+        self.label_6.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+
+        self.gridLayout.addWidget(self.label_6, 2, 1, 1, 1)
+
+        self.fisheye_x_slider = QSlider(self.tab)
+        self.fisheye_x_slider.setObjectName(u"fisheye_x_slider")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        sizePolicy1.setHorizontalStretch(100)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.fisheye_x_slider.sizePolicy().hasHeightForWidth())
+        self.fisheye_x_slider.setSizePolicy(sizePolicy1)
+        self.fisheye_x_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout.addWidget(self.fisheye_x_slider, 0, 2, 1, 1)
+
+        self.fisheye_x_spinbox = QSpinBox(self.tab)
+        self.fisheye_x_spinbox.setObjectName(u"fisheye_x_spinbox")
+
+        self.gridLayout.addWidget(self.fisheye_x_spinbox, 0, 3, 1, 1)
+
+        self.fisheye_apply_button = QPushButton(self.tab)
+        self.fisheye_apply_button.setObjectName(u"fisheye_apply_button")
+
+        self.gridLayout.addWidget(self.fisheye_apply_button, 1, 5, 1, 1)
+
+        self.label_5 = QLabel(self.tab)
+        self.label_5.setObjectName(u"label_5")
+        self.label_5.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout.addWidget(self.label_5, 1, 1, 1, 1)
+
+        self.horizontalSpacer_27 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout.addItem(self.horizontalSpacer_27, 0, 0, 1, 1)
+
+        self.horizontalSpacer_28 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout.addItem(self.horizontalSpacer_28, 1, 0, 1, 1)
+
+        self.horizontalSpacer_29 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout.addItem(self.horizontalSpacer_29, 2, 0, 1, 1)
+
+        self.horizontalSpacer_30 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout.addItem(self.horizontalSpacer_30, 1, 4, 1, 1)
+
+        self.horizontalSpacer_31 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout.addItem(self.horizontalSpacer_31, 0, 4, 1, 1)
+
+        self.horizontalSpacer_32 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout.addItem(self.horizontalSpacer_32, 2, 4, 1, 1)
+
+
+        self.horizontalLayout_5.addLayout(self.gridLayout)
+
+        self.tabWidget.addTab(self.tab, "")
+        self.tab_2 = QWidget()
+        self.tab_2.setObjectName(u"tab_2")
+        self.horizontalLayout_2 = QHBoxLayout(self.tab_2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.gridLayout_2 = QGridLayout()
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.horizontalSpacer_19 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_2.addItem(self.horizontalSpacer_19, 0, 4, 1, 1)
+
+        self.swirl_y_slider = QSlider(self.tab_2)
+        self.swirl_y_slider.setObjectName(u"swirl_y_slider")
+        sizePolicy1.setHeightForWidth(self.swirl_y_slider.sizePolicy().hasHeightForWidth())
+        self.swirl_y_slider.setSizePolicy(sizePolicy1)
+        self.swirl_y_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout_2.addWidget(self.swirl_y_slider, 1, 2, 1, 1)
+
+        self.swirl_magnitude_slider = QSlider(self.tab_2)
+        self.swirl_magnitude_slider.setObjectName(u"swirl_magnitude_slider")
+        self.swirl_magnitude_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout_2.addWidget(self.swirl_magnitude_slider, 3, 2, 1, 1)
+
+        self.label_8 = QLabel(self.tab_2)
+        self.label_8.setObjectName(u"label_8")
+        self.label_8.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_2.addWidget(self.label_8, 1, 1, 1, 1)
+
+        self.swirl_magnitude_spinbox = QDoubleSpinBox(self.tab_2)
+        self.swirl_magnitude_spinbox.setObjectName(u"swirl_magnitude_spinbox")
+
+        self.gridLayout_2.addWidget(self.swirl_magnitude_spinbox, 3, 3, 1, 1)
+
+        self.swirl_y_spinbox = QSpinBox(self.tab_2)
+        self.swirl_y_spinbox.setObjectName(u"swirl_y_spinbox")
+
+        self.gridLayout_2.addWidget(self.swirl_y_spinbox, 1, 3, 1, 1)
+
+        self.swirl_sigma_slider = QSlider(self.tab_2)
+        self.swirl_sigma_slider.setObjectName(u"swirl_sigma_slider")
+        self.swirl_sigma_slider.setMaximum(100)
+        self.swirl_sigma_slider.setValue(1)
+        self.swirl_sigma_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout_2.addWidget(self.swirl_sigma_slider, 2, 2, 1, 1)
+
+        self.label_7 = QLabel(self.tab_2)
+        self.label_7.setObjectName(u"label_7")
+        self.label_7.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_2.addWidget(self.label_7, 2, 1, 1, 1)
+
+        self.label_10 = QLabel(self.tab_2)
+        self.label_10.setObjectName(u"label_10")
+        self.label_10.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_2.addWidget(self.label_10, 0, 1, 1, 1)
+
+        self.swirl_x_spinbox = QSpinBox(self.tab_2)
+        self.swirl_x_spinbox.setObjectName(u"swirl_x_spinbox")
+
+        self.gridLayout_2.addWidget(self.swirl_x_spinbox, 0, 3, 1, 1)
+
+        self.horizontalSpacer_20 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_2.addItem(self.horizontalSpacer_20, 1, 4, 1, 1)
+
+        self.swirl_x_slider = QSlider(self.tab_2)
+        self.swirl_x_slider.setObjectName(u"swirl_x_slider")
+        self.swirl_x_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout_2.addWidget(self.swirl_x_slider, 0, 2, 1, 1)
+
+        self.swirl_sigma_spinbox = QDoubleSpinBox(self.tab_2)
+        self.swirl_sigma_spinbox.setObjectName(u"swirl_sigma_spinbox")
+
+        self.gridLayout_2.addWidget(self.swirl_sigma_spinbox, 2, 3, 1, 1)
+
+        self.label_11 = QLabel(self.tab_2)
+        self.label_11.setObjectName(u"label_11")
+        self.label_11.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_2.addWidget(self.label_11, 3, 1, 1, 1)
+
+        self.horizontalSpacer_21 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_2.addItem(self.horizontalSpacer_21, 2, 4, 1, 1)
+
+        self.horizontalSpacer_22 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_2.addItem(self.horizontalSpacer_22, 3, 4, 1, 1)
+
+        self.horizontalSpacer_23 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_2.addItem(self.horizontalSpacer_23, 0, 0, 1, 1)
+
+        self.horizontalSpacer_24 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_2.addItem(self.horizontalSpacer_24, 1, 0, 1, 1)
+
+        self.horizontalSpacer_25 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_2.addItem(self.horizontalSpacer_25, 2, 0, 1, 1)
+
+        self.horizontalSpacer_26 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_2.addItem(self.horizontalSpacer_26, 3, 0, 1, 1)
+
+
+        self.horizontalLayout_2.addLayout(self.gridLayout_2)
+
+        self.swirl_apply_button = QPushButton(self.tab_2)
+        self.swirl_apply_button.setObjectName(u"swirl_apply_button")
+
+        self.horizontalLayout_2.addWidget(self.swirl_apply_button)
+
+        self.tabWidget.addTab(self.tab_2, "")
+        self.tab_3 = QWidget()
+        self.tab_3.setObjectName(u"tab_3")
+        self.horizontalLayout_6 = QHBoxLayout(self.tab_3)
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.gridLayout_3 = QGridLayout()
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.waves_freq_slider = QSlider(self.tab_3)
+        self.waves_freq_slider.setObjectName(u"waves_freq_slider")
+        self.waves_freq_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout_3.addWidget(self.waves_freq_slider, 1, 2, 1, 1)
+
+        self.label_13 = QLabel(self.tab_3)
+        self.label_13.setObjectName(u"label_13")
+        self.label_13.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_3.addWidget(self.label_13, 2, 1, 1, 1)
+
+        self.label_14 = QLabel(self.tab_3)
+        self.label_14.setObjectName(u"label_14")
+        self.label_14.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_3.addWidget(self.label_14, 1, 1, 1, 1)
+
+        self.horizontalSpacer_15 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_3.addItem(self.horizontalSpacer_15, 2, 4, 1, 1)
+
+        self.waves_apply_button = QPushButton(self.tab_3)
+        self.waves_apply_button.setObjectName(u"waves_apply_button")
+
+        self.gridLayout_3.addWidget(self.waves_apply_button, 1, 5, 1, 1)
+
+        self.waves_phase_spinbox = QDoubleSpinBox(self.tab_3)
+        self.waves_phase_spinbox.setObjectName(u"waves_phase_spinbox")
+
+        self.gridLayout_3.addWidget(self.waves_phase_spinbox, 2, 3, 1, 1)
+
+        self.label_12 = QLabel(self.tab_3)
+        self.label_12.setObjectName(u"label_12")
+        self.label_12.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_3.addWidget(self.label_12, 0, 1, 1, 1)
+
+        self.horizontalSpacer_11 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_3.addItem(self.horizontalSpacer_11, 0, 4, 1, 1)
+
+        self.horizontalSpacer_14 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_3.addItem(self.horizontalSpacer_14, 1, 4, 1, 1)
+
+        self.waves_phase_slider = QSlider(self.tab_3)
+        self.waves_phase_slider.setObjectName(u"waves_phase_slider")
+        self.waves_phase_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout_3.addWidget(self.waves_phase_slider, 2, 2, 1, 1)
+
+        self.waves_amplitude_slider = QSlider(self.tab_3)
+        self.waves_amplitude_slider.setObjectName(u"waves_amplitude_slider")
+        sizePolicy1.setHeightForWidth(self.waves_amplitude_slider.sizePolicy().hasHeightForWidth())
+        self.waves_amplitude_slider.setSizePolicy(sizePolicy1)
+        self.waves_amplitude_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout_3.addWidget(self.waves_amplitude_slider, 0, 2, 1, 1)
+
+        self.horizontalSpacer_16 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_3.addItem(self.horizontalSpacer_16, 0, 0, 1, 1)
+
+        self.horizontalSpacer_17 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_3.addItem(self.horizontalSpacer_17, 1, 0, 1, 1)
+
+        self.horizontalSpacer_18 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_3.addItem(self.horizontalSpacer_18, 2, 0, 1, 1)
+
+        self.waves_amplitude_spinbox = QDoubleSpinBox(self.tab_3)
+        self.waves_amplitude_spinbox.setObjectName(u"waves_amplitude_spinbox")
+
+        self.gridLayout_3.addWidget(self.waves_amplitude_spinbox, 0, 3, 1, 1)
+
+        self.waves_freq_spinbox = QDoubleSpinBox(self.tab_3)
+        self.waves_freq_spinbox.setObjectName(u"waves_freq_spinbox")
+
+        self.gridLayout_3.addWidget(self.waves_freq_spinbox, 1, 3, 1, 1)
+
+
+        self.horizontalLayout_6.addLayout(self.gridLayout_3)
+
+        self.tabWidget.addTab(self.tab_3, "")
+        self.tab_4 = QWidget()
+        self.tab_4.setObjectName(u"tab_4")
+        self.horizontalLayout_9 = QHBoxLayout(self.tab_4)
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.widget_5 = QWidget(self.tab_4)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout = QHBoxLayout(self.widget_5)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalSpacer_41 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer_41)
+
+        self.label = QLabel(self.widget_5)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.cylinder_angle_slider = QSlider(self.widget_5)
+        self.cylinder_angle_slider.setObjectName(u"cylinder_angle_slider")
+        sizePolicy1.setHeightForWidth(self.cylinder_angle_slider.sizePolicy().hasHeightForWidth())
+        self.cylinder_angle_slider.setSizePolicy(sizePolicy1)
+        self.cylinder_angle_slider.setOrientation(Qt.Horizontal)
+
+        self.horizontalLayout.addWidget(self.cylinder_angle_slider)
+
+        self.cylinder_angle_spinbox = QDoubleSpinBox(self.widget_5)
+        self.cylinder_angle_spinbox.setObjectName(u"cylinder_angle_spinbox")
+
+        self.horizontalLayout.addWidget(self.cylinder_angle_spinbox)
+
+        self.horizontalSpacer_42 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer_42)
+
+
+        self.horizontalLayout_9.addWidget(self.widget_5)
+
+        self.cylinder_apply_button = QPushButton(self.tab_4)
+        self.cylinder_apply_button.setObjectName(u"cylinder_apply_button")
+
+        self.horizontalLayout_9.addWidget(self.cylinder_apply_button)
+
+        self.tabWidget.addTab(self.tab_4, "")
+        self.tab_5 = QWidget()
+        self.tab_5.setObjectName(u"tab_5")
+        self.horizontalLayout_11 = QHBoxLayout(self.tab_5)
+        self.horizontalLayout_11.setObjectName(u"horizontalLayout_11")
+        self.widget_6 = QWidget(self.tab_5)
+        self.widget_6.setObjectName(u"widget_6")
+        self.horizontalLayout_10 = QHBoxLayout(self.widget_6)
+        self.horizontalLayout_10.setObjectName(u"horizontalLayout_10")
+        self.horizontalSpacer_43 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_10.addItem(self.horizontalSpacer_43)
+
+        self.label_2 = QLabel(self.widget_6)
+        self.label_2.setObjectName(u"label_2")
+        self.label_2.setAlignment(Qt.AlignCenter)
+
+        self.horizontalLayout_10.addWidget(self.label_2)
+
+        self.radial_sigma_slider = QSlider(self.widget_6)
+        self.radial_sigma_slider.setObjectName(u"radial_sigma_slider")
+        sizePolicy1.setHeightForWidth(self.radial_sigma_slider.sizePolicy().hasHeightForWidth())
+        self.radial_sigma_slider.setSizePolicy(sizePolicy1)
+        self.radial_sigma_slider.setOrientation(Qt.Horizontal)
+
+        self.horizontalLayout_10.addWidget(self.radial_sigma_slider)
+
+        self.radial_sigma_spinbox = QDoubleSpinBox(self.widget_6)
+        self.radial_sigma_spinbox.setObjectName(u"radial_sigma_spinbox")
+
+        self.horizontalLayout_10.addWidget(self.radial_sigma_spinbox)
+
+        self.horizontalSpacer_44 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_10.addItem(self.horizontalSpacer_44)
+
+
+        self.horizontalLayout_11.addWidget(self.widget_6)
+
+        self.radial_apply_button = QPushButton(self.tab_5)
+        self.radial_apply_button.setObjectName(u"radial_apply_button")
+
+        self.horizontalLayout_11.addWidget(self.radial_apply_button)
+
+        self.tabWidget.addTab(self.tab_5, "")
+        self.tab_8 = QWidget()
+        self.tab_8.setObjectName(u"tab_8")
+        self.horizontalLayout_20 = QHBoxLayout(self.tab_8)
+        self.horizontalLayout_20.setObjectName(u"horizontalLayout_20")
+        self.widget_12 = QWidget(self.tab_8)
+        self.widget_12.setObjectName(u"widget_12")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.widget_12.sizePolicy().hasHeightForWidth())
+        self.widget_12.setSizePolicy(sizePolicy2)
+        self.verticalLayout_6 = QVBoxLayout(self.widget_12)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.verticalSpacer_4 = QSpacerItem(20, 10, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_6.addItem(self.verticalSpacer_4)
+
+        self.widget_17 = QWidget(self.widget_12)
+        self.widget_17.setObjectName(u"widget_17")
+        sizePolicy.setHeightForWidth(self.widget_17.sizePolicy().hasHeightForWidth())
+        self.widget_17.setSizePolicy(sizePolicy)
+        self.horizontalLayout_21 = QHBoxLayout(self.widget_17)
+        self.horizontalLayout_21.setObjectName(u"horizontalLayout_21")
+        self.widget_13 = QWidget(self.widget_17)
+        self.widget_13.setObjectName(u"widget_13")
+        self.horizontalLayout_16 = QHBoxLayout(self.widget_13)
+        self.horizontalLayout_16.setObjectName(u"horizontalLayout_16")
+        self.label_33 = QLabel(self.widget_13)
+        self.label_33.setObjectName(u"label_33")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Preferred)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.label_33.sizePolicy().hasHeightForWidth())
+        self.label_33.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_16.addWidget(self.label_33)
+
+        self.persmap_x1_spinbox = QSpinBox(self.widget_13)
+        self.persmap_x1_spinbox.setObjectName(u"persmap_x1_spinbox")
+
+        self.horizontalLayout_16.addWidget(self.persmap_x1_spinbox)
+
+        self.label_34 = QLabel(self.widget_13)
+        self.label_34.setObjectName(u"label_34")
+        sizePolicy3.setHeightForWidth(self.label_34.sizePolicy().hasHeightForWidth())
+        self.label_34.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_16.addWidget(self.label_34)
+
+        self.persmap_y1_spinbox = QSpinBox(self.widget_13)
+        self.persmap_y1_spinbox.setObjectName(u"persmap_y1_spinbox")
+
+        self.horizontalLayout_16.addWidget(self.persmap_y1_spinbox)
+
+        self.persmap_select1_button = QPushButton(self.widget_13)
+        self.persmap_select1_button.setObjectName(u"persmap_select1_button")
+
+        self.horizontalLayout_16.addWidget(self.persmap_select1_button)
+
+        self.horizontalSpacer_33 = QSpacerItem(30, 20, QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_16.addItem(self.horizontalSpacer_33)
+
+
+        self.horizontalLayout_21.addWidget(self.widget_13)
+
+        self.widget_14 = QWidget(self.widget_17)
+        self.widget_14.setObjectName(u"widget_14")
+        self.horizontalLayout_17 = QHBoxLayout(self.widget_14)
+        self.horizontalLayout_17.setObjectName(u"horizontalLayout_17")
+        self.label_35 = QLabel(self.widget_14)
+        self.label_35.setObjectName(u"label_35")
+        sizePolicy3.setHeightForWidth(self.label_35.sizePolicy().hasHeightForWidth())
+        self.label_35.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_17.addWidget(self.label_35)
+
+        self.persmap_x2_spinbox = QSpinBox(self.widget_14)
+        self.persmap_x2_spinbox.setObjectName(u"persmap_x2_spinbox")
+
+        self.horizontalLayout_17.addWidget(self.persmap_x2_spinbox)
+
+        self.label_36 = QLabel(self.widget_14)
+        self.label_36.setObjectName(u"label_36")
+        sizePolicy3.setHeightForWidth(self.label_36.sizePolicy().hasHeightForWidth())
+        self.label_36.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_17.addWidget(self.label_36)
+
+        self.persmap_y2_spinbox = QSpinBox(self.widget_14)
+        self.persmap_y2_spinbox.setObjectName(u"persmap_y2_spinbox")
+
+        self.horizontalLayout_17.addWidget(self.persmap_y2_spinbox)
+
+        self.persmap_select2_button = QPushButton(self.widget_14)
+        self.persmap_select2_button.setObjectName(u"persmap_select2_button")
+
+        self.horizontalLayout_17.addWidget(self.persmap_select2_button)
+
+        self.horizontalSpacer_34 = QSpacerItem(30, 20, QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_17.addItem(self.horizontalSpacer_34)
+
+
+        self.horizontalLayout_21.addWidget(self.widget_14)
+
+
+        self.verticalLayout_6.addWidget(self.widget_17)
+
+        self.widget_18 = QWidget(self.widget_12)
+        self.widget_18.setObjectName(u"widget_18")
+        self.horizontalLayout_22 = QHBoxLayout(self.widget_18)
+        self.horizontalLayout_22.setObjectName(u"horizontalLayout_22")
+        self.widget_15 = QWidget(self.widget_18)
+        self.widget_15.setObjectName(u"widget_15")
+        self.horizontalLayout_18 = QHBoxLayout(self.widget_15)
+        self.horizontalLayout_18.setObjectName(u"horizontalLayout_18")
+        self.label_37 = QLabel(self.widget_15)
+        self.label_37.setObjectName(u"label_37")
+        sizePolicy3.setHeightForWidth(self.label_37.sizePolicy().hasHeightForWidth())
+        self.label_37.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_18.addWidget(self.label_37)
+
+        self.persmap_x3_spinbox = QSpinBox(self.widget_15)
+        self.persmap_x3_spinbox.setObjectName(u"persmap_x3_spinbox")
+
+        self.horizontalLayout_18.addWidget(self.persmap_x3_spinbox)
+
+        self.label_38 = QLabel(self.widget_15)
+        self.label_38.setObjectName(u"label_38")
+        sizePolicy3.setHeightForWidth(self.label_38.sizePolicy().hasHeightForWidth())
+        self.label_38.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_18.addWidget(self.label_38)
+
+        self.persmap_y3_spinbox = QSpinBox(self.widget_15)
+        self.persmap_y3_spinbox.setObjectName(u"persmap_y3_spinbox")
+
+        self.horizontalLayout_18.addWidget(self.persmap_y3_spinbox)
+
+        self.persmap_select3_button = QPushButton(self.widget_15)
+        self.persmap_select3_button.setObjectName(u"persmap_select3_button")
+
+        self.horizontalLayout_18.addWidget(self.persmap_select3_button)
+
+        self.horizontalSpacer_35 = QSpacerItem(30, 20, QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_18.addItem(self.horizontalSpacer_35)
+
+
+        self.horizontalLayout_22.addWidget(self.widget_15)
+
+        self.widget_16 = QWidget(self.widget_18)
+        self.widget_16.setObjectName(u"widget_16")
+        self.horizontalLayout_19 = QHBoxLayout(self.widget_16)
+        self.horizontalLayout_19.setObjectName(u"horizontalLayout_19")
+        self.label_39 = QLabel(self.widget_16)
+        self.label_39.setObjectName(u"label_39")
+        sizePolicy3.setHeightForWidth(self.label_39.sizePolicy().hasHeightForWidth())
+        self.label_39.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_19.addWidget(self.label_39)
+
+        self.persmap_x4_spinbox = QSpinBox(self.widget_16)
+        self.persmap_x4_spinbox.setObjectName(u"persmap_x4_spinbox")
+
+        self.horizontalLayout_19.addWidget(self.persmap_x4_spinbox)
+
+        self.label_40 = QLabel(self.widget_16)
+        self.label_40.setObjectName(u"label_40")
+        sizePolicy3.setHeightForWidth(self.label_40.sizePolicy().hasHeightForWidth())
+        self.label_40.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_19.addWidget(self.label_40)
+
+        self.persmap_y4_spinbox = QSpinBox(self.widget_16)
+        self.persmap_y4_spinbox.setObjectName(u"persmap_y4_spinbox")
+
+        self.horizontalLayout_19.addWidget(self.persmap_y4_spinbox)
+
+        self.persmap_select4_button = QPushButton(self.widget_16)
+        self.persmap_select4_button.setObjectName(u"persmap_select4_button")
+
+        self.horizontalLayout_19.addWidget(self.persmap_select4_button)
+
+        self.horizontalSpacer_36 = QSpacerItem(30, 20, QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_19.addItem(self.horizontalSpacer_36)
+
+
+        self.horizontalLayout_22.addWidget(self.widget_16)
+
+
+        self.verticalLayout_6.addWidget(self.widget_18)
+
+        self.widget_2 = QWidget(self.widget_12)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_8 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_8.addItem(self.horizontalSpacer_2)
+
+        self.widget_4 = QWidget(self.widget_2)
+        self.widget_4.setObjectName(u"widget_4")
+        self.verticalLayout_3 = QVBoxLayout(self.widget_4)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalSpacer_5 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_3.addItem(self.verticalSpacer_5)
+
+        self.persmap_load_button = QPushButton(self.widget_4)
+        self.persmap_load_button.setObjectName(u"persmap_load_button")
+
+        self.verticalLayout_3.addWidget(self.persmap_load_button)
+
+        self.persmap_reset_button = QPushButton(self.widget_4)
+        self.persmap_reset_button.setObjectName(u"persmap_reset_button")
+
+        self.verticalLayout_3.addWidget(self.persmap_reset_button)
+
+        self.verticalSpacer_6 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_3.addItem(self.verticalSpacer_6)
+
+
+        self.horizontalLayout_8.addWidget(self.widget_4)
+
+        self.persmap_graphicsView = QGraphicsView(self.widget_2)
+        self.persmap_graphicsView.setObjectName(u"persmap_graphicsView")
+
+        self.horizontalLayout_8.addWidget(self.persmap_graphicsView)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_8.addItem(self.horizontalSpacer)
+
+
+        self.verticalLayout_6.addWidget(self.widget_2)
+
+        self.verticalSpacer_3 = QSpacerItem(20, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_6.addItem(self.verticalSpacer_3)
+
+
+        self.horizontalLayout_20.addWidget(self.widget_12)
+
+        self.persmap_apply_button = QPushButton(self.tab_8)
+        self.persmap_apply_button.setObjectName(u"persmap_apply_button")
+
+        self.horizontalLayout_20.addWidget(self.persmap_apply_button)
+
+        self.tabWidget.addTab(self.tab_8, "")
+        self.tab_7 = QWidget()
+        self.tab_7.setObjectName(u"tab_7")
+        self.horizontalLayout_12 = QHBoxLayout(self.tab_7)
+        self.horizontalLayout_12.setObjectName(u"horizontalLayout_12")
+        self.gridLayout_5 = QGridLayout()
+        self.gridLayout_5.setObjectName(u"gridLayout_5")
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_5.addItem(self.horizontalSpacer_3, 1, 0, 1, 1)
+
+        self.square_eye_p_slider = QSlider(self.tab_7)
+        self.square_eye_p_slider.setObjectName(u"square_eye_p_slider")
+        self.square_eye_p_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout_5.addWidget(self.square_eye_p_slider, 3, 2, 1, 1)
+
+        self.square_eye_y_spinbox = QSpinBox(self.tab_7)
+        self.square_eye_y_spinbox.setObjectName(u"square_eye_y_spinbox")
+
+        self.gridLayout_5.addWidget(self.square_eye_y_spinbox, 1, 3, 1, 1)
+
+        self.square_eye_sigma_spinbox = QDoubleSpinBox(self.tab_7)
+        self.square_eye_sigma_spinbox.setObjectName(u"square_eye_sigma_spinbox")
+
+        self.gridLayout_5.addWidget(self.square_eye_sigma_spinbox, 2, 3, 1, 1)
+
+        self.square_eye_y_slider = QSlider(self.tab_7)
+        self.square_eye_y_slider.setObjectName(u"square_eye_y_slider")
+        self.square_eye_y_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout_5.addWidget(self.square_eye_y_slider, 1, 2, 1, 1)
+
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_5.addItem(self.horizontalSpacer_4, 0, 0, 1, 1)
+
+        self.label_25 = QLabel(self.tab_7)
+        self.label_25.setObjectName(u"label_25")
+        self.label_25.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_5.addWidget(self.label_25, 3, 1, 1, 1)
+
+        self.label_26 = QLabel(self.tab_7)
+        self.label_26.setObjectName(u"label_26")
+        self.label_26.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_5.addWidget(self.label_26, 1, 1, 1, 1)
+
+        self.square_eye_sigma_slider = QSlider(self.tab_7)
+        self.square_eye_sigma_slider.setObjectName(u"square_eye_sigma_slider")
+        self.square_eye_sigma_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout_5.addWidget(self.square_eye_sigma_slider, 2, 2, 1, 1)
+
+        self.horizontalSpacer_6 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_5.addItem(self.horizontalSpacer_6, 3, 0, 1, 1)
+
+        self.square_eye_p_spinbox = QDoubleSpinBox(self.tab_7)
+        self.square_eye_p_spinbox.setObjectName(u"square_eye_p_spinbox")
+
+        self.gridLayout_5.addWidget(self.square_eye_p_spinbox, 3, 3, 1, 1)
+
+        self.square_eye_x_spinbox = QSpinBox(self.tab_7)
+        self.square_eye_x_spinbox.setObjectName(u"square_eye_x_spinbox")
+
+        self.gridLayout_5.addWidget(self.square_eye_x_spinbox, 0, 3, 1, 1)
+
+        self.label_24 = QLabel(self.tab_7)
+        self.label_24.setObjectName(u"label_24")
+        self.label_24.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_5.addWidget(self.label_24, 0, 1, 1, 1)
+
+        self.horizontalSpacer_5 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_5.addItem(self.horizontalSpacer_5, 2, 0, 1, 1)
+
+        self.label_23 = QLabel(self.tab_7)
+        self.label_23.setObjectName(u"label_23")
+        self.label_23.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_5.addWidget(self.label_23, 2, 1, 1, 1)
+
+        self.square_eye_x_slider = QSlider(self.tab_7)
+        self.square_eye_x_slider.setObjectName(u"square_eye_x_slider")
+        sizePolicy1.setHeightForWidth(self.square_eye_x_slider.sizePolicy().hasHeightForWidth())
+        self.square_eye_x_slider.setSizePolicy(sizePolicy1)
+        self.square_eye_x_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout_5.addWidget(self.square_eye_x_slider, 0, 2, 1, 1)
+
+        self.horizontalSpacer_37 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_5.addItem(self.horizontalSpacer_37, 2, 4, 1, 1)
+
+        self.horizontalSpacer_38 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_5.addItem(self.horizontalSpacer_38, 1, 4, 1, 1)
+
+        self.horizontalSpacer_39 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_5.addItem(self.horizontalSpacer_39, 0, 4, 1, 1)
+
+        self.horizontalSpacer_40 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_5.addItem(self.horizontalSpacer_40, 3, 4, 1, 1)
+
+
+        self.horizontalLayout_12.addLayout(self.gridLayout_5)
+
+        self.square_eye_apply_button = QPushButton(self.tab_7)
+        self.square_eye_apply_button.setObjectName(u"square_eye_apply_button")
+
+        self.horizontalLayout_12.addWidget(self.square_eye_apply_button)
+
+        self.tabWidget.addTab(self.tab_7, "")
+        self.tab_6 = QWidget()
+        self.tab_6.setObjectName(u"tab_6")
+        self.horizontalLayout_28 = QHBoxLayout(self.tab_6)
+        self.horizontalLayout_28.setObjectName(u"horizontalLayout_28")
+        self.widget_21 = QWidget(self.tab_6)
+        self.widget_21.setObjectName(u"widget_21")
+        self.horizontalLayout_26 = QHBoxLayout(self.widget_21)
+        self.horizontalLayout_26.setObjectName(u"horizontalLayout_26")
+        self.horizontalSpacer_53 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_26.addItem(self.horizontalSpacer_53)
+
+        self.label_16 = QLabel(self.widget_21)
+        self.label_16.setObjectName(u"label_16")
+
+        self.horizontalLayout_26.addWidget(self.label_16)
+
+        self.median_size_slider = QSlider(self.widget_21)
+        self.median_size_slider.setObjectName(u"median_size_slider")
+        sizePolicy1.setHeightForWidth(self.median_size_slider.sizePolicy().hasHeightForWidth())
+        self.median_size_slider.setSizePolicy(sizePolicy1)
+        self.median_size_slider.setMinimum(1)
+        self.median_size_slider.setMaximum(41)
+        self.median_size_slider.setSingleStep(5)
+        self.median_size_slider.setOrientation(Qt.Horizontal)
+
+        self.horizontalLayout_26.addWidget(self.median_size_slider)
+
+        self.median_size_spinbox = QDoubleSpinBox(self.widget_21)
+        self.median_size_spinbox.setObjectName(u"median_size_spinbox")
+        self.median_size_spinbox.setMinimum(1.000000000000000)
+        self.median_size_spinbox.setMaximum(41.000000000000000)
+        self.median_size_spinbox.setSingleStep(2.000000000000000)
+
+        self.horizontalLayout_26.addWidget(self.median_size_spinbox)
+
+        self.horizontalSpacer_54 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_26.addItem(self.horizontalSpacer_54)
+
+
+        self.horizontalLayout_28.addWidget(self.widget_21)
+
+        self.median_apply_button = QPushButton(self.tab_6)
+        self.median_apply_button.setObjectName(u"median_apply_button")
+
+        self.horizontalLayout_28.addWidget(self.median_apply_button)
+
+        self.tabWidget.addTab(self.tab_6, "")
+        self.tab_9 = QWidget()
+        self.tab_9.setObjectName(u"tab_9")
+        self.horizontalLayout_7 = QHBoxLayout(self.tab_9)
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.widget_19 = QWidget(self.tab_9)
+        self.widget_19.setObjectName(u"widget_19")
+        self.horizontalLayout_24 = QHBoxLayout(self.widget_19)
+        self.horizontalLayout_24.setObjectName(u"horizontalLayout_24")
+        self.horizontalSpacer_48 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_24.addItem(self.horizontalSpacer_48)
+
+        self.label_4 = QLabel(self.widget_19)
+        self.label_4.setObjectName(u"label_4")
+
+        self.horizontalLayout_24.addWidget(self.label_4)
+
+        self.gaussian_radius_slider = QSlider(self.widget_19)
+        self.gaussian_radius_slider.setObjectName(u"gaussian_radius_slider")
+        sizePolicy1.setHeightForWidth(self.gaussian_radius_slider.sizePolicy().hasHeightForWidth())
+        self.gaussian_radius_slider.setSizePolicy(sizePolicy1)
+        self.gaussian_radius_slider.setOrientation(Qt.Horizontal)
+
+        self.horizontalLayout_24.addWidget(self.gaussian_radius_slider)
+
+        self.gaussian_radius_spinbox = QDoubleSpinBox(self.widget_19)
+        self.gaussian_radius_spinbox.setObjectName(u"gaussian_radius_spinbox")
+
+        self.horizontalLayout_24.addWidget(self.gaussian_radius_spinbox)
+
+        self.horizontalSpacer_47 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_24.addItem(self.horizontalSpacer_47)
+
+
+        self.horizontalLayout_7.addWidget(self.widget_19)
+
+        self.gaussian_apply_button = QPushButton(self.tab_9)
+        self.gaussian_apply_button.setObjectName(u"gaussian_apply_button")
+
+        self.horizontalLayout_7.addWidget(self.gaussian_apply_button)
+
+        self.tabWidget.addTab(self.tab_9, "")
+        self.tab_10 = QWidget()
+        self.tab_10.setObjectName(u"tab_10")
+        self.horizontalLayout_23 = QHBoxLayout(self.tab_10)
+        self.horizontalLayout_23.setObjectName(u"horizontalLayout_23")
+        self.gridLayout_6 = QGridLayout()
+        self.gridLayout_6.setObjectName(u"gridLayout_6")
+        self.horizontalSpacer_56 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_6.addItem(self.horizontalSpacer_56, 1, 4, 1, 1)
+
+        self.bilateral_rho_slider = QSlider(self.tab_10)
+        self.bilateral_rho_slider.setObjectName(u"bilateral_rho_slider")
+        self.bilateral_rho_slider.setMaximum(20)
+        self.bilateral_rho_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout_6.addWidget(self.bilateral_rho_slider, 1, 2, 1, 1)
+
+        self.label_42 = QLabel(self.tab_10)
+        self.label_42.setObjectName(u"label_42")
+        self.label_42.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_6.addWidget(self.label_42, 1, 1, 1, 1)
+
+        self.label_43 = QLabel(self.tab_10)
+        self.label_43.setObjectName(u"label_43")
+        self.label_43.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_6.addWidget(self.label_43, 0, 1, 1, 1)
+
+        self.horizontalSpacer_51 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_6.addItem(self.horizontalSpacer_51, 1, 0, 1, 1)
+
+        self.bilateral_sigma_slider = QSlider(self.tab_10)
+        self.bilateral_sigma_slider.setObjectName(u"bilateral_sigma_slider")
+        sizePolicy1.setHeightForWidth(self.bilateral_sigma_slider.sizePolicy().hasHeightForWidth())
+        self.bilateral_sigma_slider.setSizePolicy(sizePolicy1)
+        self.bilateral_sigma_slider.setMaximum(50)
+        self.bilateral_sigma_slider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout_6.addWidget(self.bilateral_sigma_slider, 0, 2, 1, 1)
+
+        self.horizontalSpacer_52 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_6.addItem(self.horizontalSpacer_52, 0, 0, 1, 1)
+
+        self.horizontalSpacer_57 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.gridLayout_6.addItem(self.horizontalSpacer_57, 0, 4, 1, 1)
+
+        self.bilateral_sigma_spinbox = QDoubleSpinBox(self.tab_10)
+        self.bilateral_sigma_spinbox.setObjectName(u"bilateral_sigma_spinbox")
+        self.bilateral_sigma_spinbox.setMaximum(50.000000000000000)
+
+        self.gridLayout_6.addWidget(self.bilateral_sigma_spinbox, 0, 3, 1, 1)
+
+        self.bilateral_rho_spinbox = QDoubleSpinBox(self.tab_10)
+        self.bilateral_rho_spinbox.setObjectName(u"bilateral_rho_spinbox")
+        self.bilateral_rho_spinbox.setMaximum(20.000000000000000)
+
+        self.gridLayout_6.addWidget(self.bilateral_rho_spinbox, 1, 3, 1, 1)
+
+
+        self.horizontalLayout_23.addLayout(self.gridLayout_6)
+
+        self.bilateral_apply_button = QPushButton(self.tab_10)
+        self.bilateral_apply_button.setObjectName(u"bilateral_apply_button")
+
+        self.horizontalLayout_23.addWidget(self.bilateral_apply_button)
+
+        self.tabWidget.addTab(self.tab_10, "")
+        self.tab_12 = QWidget()
+        self.tab_12.setObjectName(u"tab_12")
+        self.horizontalLayout_27 = QHBoxLayout(self.tab_12)
+        self.horizontalLayout_27.setObjectName(u"horizontalLayout_27")
+        self.widget_20 = QWidget(self.tab_12)
+        self.widget_20.setObjectName(u"widget_20")
+        self.horizontalLayout_25 = QHBoxLayout(self.widget_20)
+        self.horizontalLayout_25.setObjectName(u"horizontalLayout_25")
+        self.horizontalSpacer_49 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_25.addItem(self.horizontalSpacer_49)
+
+        self.label_15 = QLabel(self.widget_20)
+        self.label_15.setObjectName(u"label_15")
+
+        self.horizontalLayout_25.addWidget(self.label_15)
+
+        self.mean_size_slider = QSlider(self.widget_20)
+        self.mean_size_slider.setObjectName(u"mean_size_slider")
+        sizePolicy1.setHeightForWidth(self.mean_size_slider.sizePolicy().hasHeightForWidth())
+        self.mean_size_slider.setSizePolicy(sizePolicy1)
+        self.mean_size_slider.setOrientation(Qt.Horizontal)
+
+        self.horizontalLayout_25.addWidget(self.mean_size_slider)
+
+        self.mean_size_spinbox = QDoubleSpinBox(self.widget_20)
+        self.mean_size_spinbox.setObjectName(u"mean_size_spinbox")
+
+        self.horizontalLayout_25.addWidget(self.mean_size_spinbox)
+
+        self.horizontalSpacer_50 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_25.addItem(self.horizontalSpacer_50)
+
+
+        self.horizontalLayout_27.addWidget(self.widget_20)
+
+        self.mean_apply_button = QPushButton(self.tab_12)
+        self.mean_apply_button.setObjectName(u"mean_apply_button")
+
+        self.horizontalLayout_27.addWidget(self.mean_apply_button)
+
+        self.tabWidget.addTab(self.tab_12, "")
+
+        self.verticalLayout.addWidget(self.tabWidget)
+
+
+        self.horizontalLayout_3.addWidget(self.frame)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.statusbar = QStatusBar(MainWindow)
+        self.statusbar.setObjectName(u"statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+
+        self.tabWidget.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"MainWindow", None))
+        ___qtreewidgetitem = self.treeWidget.headerItem()
+        ___qtreewidgetitem.setText(0, QCoreApplication.translate("MainWindow", u"Dashboard", None))
+
+        __sortingEnabled = self.treeWidget.isSortingEnabled()
+        self.treeWidget.setSortingEnabled(False)
+        ___qtreewidgetitem1 = self.treeWidget.topLevelItem(0)
+        ___qtreewidgetitem1.setText(0, QCoreApplication.translate("MainWindow", u"Image Warping", None))
+        ___qtreewidgetitem2 = ___qtreewidgetitem1.child(0)
+        ___qtreewidgetitem2.setText(0, QCoreApplication.translate("MainWindow", u"Fish Eye Effect", None))
+        ___qtreewidgetitem3 = ___qtreewidgetitem1.child(1)
+        ___qtreewidgetitem3.setText(0, QCoreApplication.translate("MainWindow", u"Swirl Effect", None))
+        ___qtreewidgetitem4 = ___qtreewidgetitem1.child(2)
+        ___qtreewidgetitem4.setText(0, QCoreApplication.translate("MainWindow", u"Waves Effect", None))
+        ___qtreewidgetitem5 = ___qtreewidgetitem1.child(3)
+        ___qtreewidgetitem5.setText(0, QCoreApplication.translate("MainWindow", u"Cylinder Anamorphosis", None))
+        ___qtreewidgetitem6 = ___qtreewidgetitem1.child(4)
+        ___qtreewidgetitem6.setText(0, QCoreApplication.translate("MainWindow", u"Radial Blur Effect", None))
+        ___qtreewidgetitem7 = ___qtreewidgetitem1.child(5)
+        ___qtreewidgetitem7.setText(0, QCoreApplication.translate("MainWindow", u"Perspective Mapping", None))
+        ___qtreewidgetitem8 = ___qtreewidgetitem1.child(6)
+        ___qtreewidgetitem8.setText(0, QCoreApplication.translate("MainWindow", u"Square Eye Effect", None))
+        ___qtreewidgetitem9 = self.treeWidget.topLevelItem(1)
+        ___qtreewidgetitem9.setText(0, QCoreApplication.translate("MainWindow", u"Image Filtering", None))
+        ___qtreewidgetitem10 = ___qtreewidgetitem9.child(0)
+        ___qtreewidgetitem10.setText(0, QCoreApplication.translate("MainWindow", u"Median Blurring", None))
+        ___qtreewidgetitem11 = ___qtreewidgetitem9.child(1)
+        ___qtreewidgetitem11.setText(0, QCoreApplication.translate("MainWindow", u"Gaussian Filtering", None))
+        ___qtreewidgetitem12 = ___qtreewidgetitem9.child(2)
+        ___qtreewidgetitem12.setText(0, QCoreApplication.translate("MainWindow", u"Bilateral Filter", None))
+        ___qtreewidgetitem13 = ___qtreewidgetitem9.child(3)
+        ___qtreewidgetitem13.setText(0, QCoreApplication.translate("MainWindow", u"Mean Filter", None))
+        ___qtreewidgetitem14 = self.treeWidget.topLevelItem(2)
+        ___qtreewidgetitem14.setText(0, QCoreApplication.translate("MainWindow", u"About", None))
+        self.treeWidget.setSortingEnabled(__sortingEnabled)
+
+#if QT_CONFIG(accessibility)
+        self.graphicsView.setAccessibleName(QCoreApplication.translate("MainWindow", u"graphicsView", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(tooltip)
+        self.load_button.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Tool Tip</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(whatsthis)
+        self.load_button.setWhatsThis(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Whats this</p></body></html>", None))
+#endif // QT_CONFIG(whatsthis)
+#if QT_CONFIG(accessibility)
+        self.load_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"load_or_save_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.load_button.setText(QCoreApplication.translate("MainWindow", u"Load", None))
+#if QT_CONFIG(accessibility)
+        self.save_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"load_or_save_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.save_button.setText(QCoreApplication.translate("MainWindow", u"Save", None))
+#if QT_CONFIG(accessibility)
+        self.reset_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"reset_or_undo_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.reset_button.setText(QCoreApplication.translate("MainWindow", u"Reset", None))
+#if QT_CONFIG(tooltip)
+        self.undo_button.setToolTip(QCoreApplication.translate("MainWindow", u"Undo the last applied effect", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(accessibility)
+        self.undo_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"reset_or_undo_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.undo_button.setText(QCoreApplication.translate("MainWindow", u"Undo", None))
+#if QT_CONFIG(tooltip)
+        self.tabWidget.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(accessibility)
+        self.tabWidget.setAccessibleName(QCoreApplication.translate("MainWindow", u"tab_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.icon_label.setText(QCoreApplication.translate("MainWindow", u"icon", None))
+        self.label_27.setText(QCoreApplication.translate("MainWindow", u"IMAGE PROCESSING TOOL", None))
+#if QT_CONFIG(accessibility)
+        self.label_28.setAccessibleName(QCoreApplication.translate("MainWindow", u"second_title", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_28.setText(QCoreApplication.translate("MainWindow", u"Mini Project", None))
+#if QT_CONFIG(accessibility)
+        self.label_29.setAccessibleName(QCoreApplication.translate("MainWindow", u"info_label", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_29.setText(QCoreApplication.translate("MainWindow", u"  To inspect the project, please visit", None))
+#if QT_CONFIG(accessibility)
+        self.label_30.setAccessibleName(QCoreApplication.translate("MainWindow", u"info_label", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_30.setText(QCoreApplication.translate("MainWindow", u"<ul style=\"margin-top: 0px; margin-bottom: 0px; margin-left: 0px; margin-right: 0px; -qt-list-indent: 1;\"><li style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">\n"
+"The <a href=\"https://github.com/elifcansuyildiz/ImageProcessingQtApplication\" style=\"text-decoration: none\"><span style=\" color:#439ae5;\">github repository</span></a> for the project source code </li></ul>", None))
+#if QT_CONFIG(accessibility)
+        self.label_31.setAccessibleName(QCoreApplication.translate("MainWindow", u"info_label", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_31.setText(QCoreApplication.translate("MainWindow", u"<ul style=\"margin-top: 0px; margin-bottom: 0px; margin-left: 0px; margin-right: 0px; -qt-list-indent: 1;\"><li style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">The <a href=\"https://elifcansuyildiz.github.io/blog/ImageWarping\" style=\"text-decoration: none\"><span style=\" color:#439ae5;\">jupyter notebook</span></a> for the Image Warping techniques </li></ul>", None))
+#if QT_CONFIG(accessibility)
+        self.label_32.setAccessibleName(QCoreApplication.translate("MainWindow", u"info_label", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_32.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><ul style=\"margin-top: 0px; margin-bottom: 0px; margin-left: 0px; margin-right: 0px; -qt-list-indent: 1;\"><li style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">\n"
+"The <a href=\"link-address\" style=\"text-decoration: none\"><span style=\" color:#439ae5;\">jupyter notebook</span></a> for the Image Filtering techniques </li></ul></body></html>", None))
+#if QT_CONFIG(accessibility)
+        self.label_3.setAccessibleName(QCoreApplication.translate("MainWindow", u"info_label", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_3.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><ul style=\"margin-top: 0px; margin-bottom: 0px; margin-left: 0px; margin-right: 0px; -qt-list-indent: 1;\"><li style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">\n"
+"The <a href=\"https://youtu.be/8llrNf-44yw\" style=\"text-decoration: none\"><span style=\" color:#439ae5;\">youtube video</span></a> for the functionalities of the tool </li></ul></body></html>", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_11), QCoreApplication.translate("MainWindow", u"0", None))
+#if QT_CONFIG(accessibility)
+        self.fisheye_sigma_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"fisheye_sigma", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.fisheye_y_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"y", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.fisheye_sigma_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"fisheye_sigma", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.fisheye_y_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"y", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_9.setText(QCoreApplication.translate("MainWindow", u"x", None))
+        self.label_6.setText(QCoreApplication.translate("MainWindow", u"sigma", None))
+#if QT_CONFIG(accessibility)
+        self.fisheye_x_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"x", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(tooltip)
+        self.fisheye_x_spinbox.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(accessibility)
+        self.fisheye_x_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"x", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(tooltip)
+        self.fisheye_apply_button.setToolTip(QCoreApplication.translate("MainWindow", u"Apply this effect permanently! You can click undo button to roll back to the previous state.", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(accessibility)
+        self.fisheye_apply_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"tab_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.fisheye_apply_button.setText(QCoreApplication.translate("MainWindow", u"Apply", None))
+        self.label_5.setText(QCoreApplication.translate("MainWindow", u"y", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab), QCoreApplication.translate("MainWindow", u"1", None))
+#if QT_CONFIG(accessibility)
+        self.swirl_y_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"y", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.swirl_magnitude_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"magnitude", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_8.setText(QCoreApplication.translate("MainWindow", u"y", None))
+#if QT_CONFIG(accessibility)
+        self.swirl_magnitude_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"magnitude", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.swirl_y_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"y", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.swirl_sigma_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"swirl_sigma", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_7.setText(QCoreApplication.translate("MainWindow", u"sigma", None))
+        self.label_10.setText(QCoreApplication.translate("MainWindow", u"x", None))
+#if QT_CONFIG(accessibility)
+        self.swirl_x_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"x", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.swirl_x_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"x", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.swirl_sigma_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"swirl_sigma", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_11.setText(QCoreApplication.translate("MainWindow", u"magnitude", None))
+#if QT_CONFIG(tooltip)
+        self.swirl_apply_button.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Apply this effect permanently! You can click undo button to roll back to the previous state.</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(accessibility)
+        self.swirl_apply_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"tab_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.swirl_apply_button.setText(QCoreApplication.translate("MainWindow", u"Apply", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_2), QCoreApplication.translate("MainWindow", u"2", None))
+#if QT_CONFIG(accessibility)
+        self.waves_freq_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"frequency", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_13.setText(QCoreApplication.translate("MainWindow", u"phase", None))
+        self.label_14.setText(QCoreApplication.translate("MainWindow", u"1/frequence", None))
+#if QT_CONFIG(tooltip)
+        self.waves_apply_button.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Apply this effect permanently! You can click undo button to roll back to the previous state.</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(accessibility)
+        self.waves_apply_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"tab_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.waves_apply_button.setText(QCoreApplication.translate("MainWindow", u"Apply", None))
+        self.label_12.setText(QCoreApplication.translate("MainWindow", u"amplitude", None))
+#if QT_CONFIG(accessibility)
+        self.waves_amplitude_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"amplitude", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.waves_amplitude_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"amplitude", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.waves_freq_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"frequency", None))
+#endif // QT_CONFIG(accessibility)
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_3), QCoreApplication.translate("MainWindow", u"3", None))
+        self.label.setText(QCoreApplication.translate("MainWindow", u"angle", None))
+#if QT_CONFIG(accessibility)
+        self.cylinder_angle_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"cylinder_angle", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.cylinder_angle_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"cylinder_angle", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(tooltip)
+        self.cylinder_apply_button.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Apply this effect permanently! You can click undo button to roll back to the previous state.</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(accessibility)
+        self.cylinder_apply_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"tab_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.cylinder_apply_button.setText(QCoreApplication.translate("MainWindow", u"Apply", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_4), QCoreApplication.translate("MainWindow", u"4", None))
+        self.label_2.setText(QCoreApplication.translate("MainWindow", u"sigma", None))
+#if QT_CONFIG(accessibility)
+        self.radial_sigma_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"radial_sigma", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.radial_sigma_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"radial_sigma", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(tooltip)
+        self.radial_apply_button.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Apply this effect permanently! You can click undo button to roll back to the previous state.</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(accessibility)
+        self.radial_apply_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"tab_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.radial_apply_button.setText(QCoreApplication.translate("MainWindow", u"Apply", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_5), QCoreApplication.translate("MainWindow", u"5", None))
+        self.label_33.setText(QCoreApplication.translate("MainWindow", u"x1", None))
+#if QT_CONFIG(accessibility)
+        self.persmap_x1_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"x", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_34.setText(QCoreApplication.translate("MainWindow", u"y1", None))
+#if QT_CONFIG(accessibility)
+        self.persmap_y1_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"y", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.persmap_select1_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"perspective_mapping_select_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.persmap_select1_button.setText(QCoreApplication.translate("MainWindow", u"Select", None))
+        self.label_35.setText(QCoreApplication.translate("MainWindow", u"x2", None))
+#if QT_CONFIG(accessibility)
+        self.persmap_x2_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"x", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_36.setText(QCoreApplication.translate("MainWindow", u"y2", None))
+#if QT_CONFIG(accessibility)
+        self.persmap_y2_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"y", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.persmap_select2_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"perspective_mapping_select_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.persmap_select2_button.setText(QCoreApplication.translate("MainWindow", u"Select", None))
+        self.label_37.setText(QCoreApplication.translate("MainWindow", u"x3", None))
+#if QT_CONFIG(accessibility)
+        self.persmap_x3_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"x", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_38.setText(QCoreApplication.translate("MainWindow", u"y3", None))
+#if QT_CONFIG(accessibility)
+        self.persmap_y3_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"y", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.persmap_select3_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"perspective_mapping_select_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.persmap_select3_button.setText(QCoreApplication.translate("MainWindow", u"Select", None))
+        self.label_39.setText(QCoreApplication.translate("MainWindow", u"x4", None))
+#if QT_CONFIG(accessibility)
+        self.persmap_x4_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"x", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_40.setText(QCoreApplication.translate("MainWindow", u"y4", None))
+#if QT_CONFIG(accessibility)
+        self.persmap_y4_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"y", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.persmap_select4_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"perspective_mapping_select_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.persmap_select4_button.setText(QCoreApplication.translate("MainWindow", u"Select", None))
+#if QT_CONFIG(tooltip)
+        self.persmap_load_button.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(accessibility)
+        self.persmap_load_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"perspective_mapping_select_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.persmap_load_button.setText(QCoreApplication.translate("MainWindow", u"Load Second Image", None))
+#if QT_CONFIG(accessibility)
+        self.persmap_reset_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"perspective_mapping_select_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.persmap_reset_button.setText(QCoreApplication.translate("MainWindow", u"Reset", None))
+#if QT_CONFIG(accessibility)
+        self.persmap_graphicsView.setAccessibleName(QCoreApplication.translate("MainWindow", u"persmap_graphicsView", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(tooltip)
+        self.persmap_apply_button.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Apply this effect permanently! You can click undo button to roll back to the previous state.</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(accessibility)
+        self.persmap_apply_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"tab_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.persmap_apply_button.setText(QCoreApplication.translate("MainWindow", u"Apply", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_8), QCoreApplication.translate("MainWindow", u"6", None))
+#if QT_CONFIG(accessibility)
+        self.square_eye_p_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"p_value", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.square_eye_y_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"y", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.square_eye_sigma_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"squareeye_sigma", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.square_eye_y_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"y", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_25.setText(QCoreApplication.translate("MainWindow", u"p value", None))
+        self.label_26.setText(QCoreApplication.translate("MainWindow", u"center y", None))
+#if QT_CONFIG(accessibility)
+        self.square_eye_sigma_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"squareeye_sigma", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.square_eye_p_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"p_value", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.square_eye_x_spinbox.setAccessibleName(QCoreApplication.translate("MainWindow", u"x", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_24.setText(QCoreApplication.translate("MainWindow", u"center x", None))
+        self.label_23.setText(QCoreApplication.translate("MainWindow", u"sigma", None))
+#if QT_CONFIG(accessibility)
+        self.square_eye_x_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"x", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(tooltip)
+        self.square_eye_apply_button.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Apply this effect permanently! You can click undo button to roll back to the previous state.</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(accessibility)
+        self.square_eye_apply_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"tab_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.square_eye_apply_button.setText(QCoreApplication.translate("MainWindow", u"Apply", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_7), QCoreApplication.translate("MainWindow", u"7", None))
+        self.label_16.setText(QCoreApplication.translate("MainWindow", u"size", None))
+#if QT_CONFIG(accessibility)
+        self.median_size_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"median_slider", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.median_apply_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"tab_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.median_apply_button.setText(QCoreApplication.translate("MainWindow", u"Apply", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_6), QCoreApplication.translate("MainWindow", u"8", None))
+        self.label_4.setText(QCoreApplication.translate("MainWindow", u"radius", None))
+#if QT_CONFIG(accessibility)
+        self.gaussian_apply_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"tab_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.gaussian_apply_button.setText(QCoreApplication.translate("MainWindow", u"Apply", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_9), QCoreApplication.translate("MainWindow", u"9", None))
+#if QT_CONFIG(accessibility)
+        self.bilateral_rho_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"y", None))
+#endif // QT_CONFIG(accessibility)
+        self.label_42.setText(QCoreApplication.translate("MainWindow", u"rho", None))
+        self.label_43.setText(QCoreApplication.translate("MainWindow", u"sigma", None))
+#if QT_CONFIG(accessibility)
+        self.bilateral_sigma_slider.setAccessibleName(QCoreApplication.translate("MainWindow", u"x", None))
+#endif // QT_CONFIG(accessibility)
+#if QT_CONFIG(accessibility)
+        self.bilateral_apply_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"tab_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.bilateral_apply_button.setText(QCoreApplication.translate("MainWindow", u"Apply", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_10), QCoreApplication.translate("MainWindow", u"10", None))
+        self.label_15.setText(QCoreApplication.translate("MainWindow", u"size", None))
+#if QT_CONFIG(accessibility)
+        self.mean_apply_button.setAccessibleName(QCoreApplication.translate("MainWindow", u"tab_button", None))
+#endif // QT_CONFIG(accessibility)
+        self.mean_apply_button.setText(QCoreApplication.translate("MainWindow", u"Apply", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_12), QCoreApplication.translate("MainWindow", u"11", None))
+    # retranslateUi
+